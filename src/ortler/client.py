@@ -7,6 +7,8 @@ import os
 import sys
 
 import openreview
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .log import log
 
@@ -24,6 +26,28 @@ _client_instance = None
 _client_v1_instance = None
 
 
+def _tune_session(client) -> None:
+    """
+    Mount a pooled HTTP adapter with retries on the client's requests
+    session. Concurrent API calls then reuse TCP/TLS connections instead
+    of paying a handshake each, and transient rate-limit or gateway
+    errors are retried with backoff instead of failing the call.
+    """
+    session = getattr(client, "session", None)
+    if session is None:
+        return
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+
+
 def _handle_openreview_exception(e: openreview.OpenReviewException) -> None:
     """
     Handle OpenReview API exceptions with user-friendly error messages.
@@ -69,6 +93,8 @@ def get_client() -> openreview.api.OpenReviewClient:
             impersonate = os.environ.get("OPENREVIEW_IMPERSONATE_GROUP")
             if impersonate:
                 _client_instance.impersonate(impersonate)
+
+            _tune_session(_client_instance)
         except openreview.OpenReviewException as e:
             _handle_openreview_exception(e)
 
@@ -106,6 +132,7 @@ def get_client_v1() -> openreview.Client:
                 username=os.environ.get("OPENREVIEW_USERNAME"),
                 password=os.environ.get("OPENREVIEW_PASSWORD"),
             )
+            _tune_session(_client_v1_instance)
         except openreview.OpenReviewException as e:
             _handle_openreview_exception(e)
 
@@ -3,7 +3,6 @@ AI Review command for generating reviews using OpenAI GPT-4.
 """
 
 import base64
-import json
 import os
 import time
 from argparse import ArgumentParser, Namespace
@@ -11,6 +10,7 @@ from io import BytesIO
 from pathlib import Path
 from typing import Any
 
+import orjson
 from openai import OpenAI
 from pdf2image import convert_from_path
 
@@ -137,7 +137,7 @@ def review_pdf(
     )
 
     review_text = response.choices[0].message.content
-    review_dict = json.loads(review_text)
+    review_dict = orjson.loads(review_text)
 
     input_tokens = response.usage.prompt_tokens
     output_tokens = response.usage.completion_tokens
@@ -206,16 +206,14 @@ class AiReviewCommand(Command):
         """Load review from cache if available."""
         review_path = self._get_review_path(cache_dir, submission_id)
         if review_path.exists():
-            with open(review_path) as f:
-                return json.load(f)
+            return orjson.loads(review_path.read_bytes())
         return None
 
     def _save_review(self, cache_dir: str, submission_id: str, review: dict) -> None:
         """Save review to cache."""
         review_path = self._get_review_path(cache_dir, submission_id)
         review_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(review_path, "w") as f:
-            json.dump(review, f, indent=2, ensure_ascii=False)
+        review_path.write_bytes(orjson.dumps(review, option=orjson.OPT_INDENT_2))
 
     def execute(self, args: Namespace) -> None:
         """
@@ -2,9 +2,15 @@
 Dump command for outputting all cached data as RDF.
 """
 
-import json
+import os
 from argparse import ArgumentParser, Namespace
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
+
+import orjson
 
 from ..command import Command
 from ..rdf import Rdf
@@ -13,6 +19,34 @@ from ..log import log
 from ..custom_stages import get_all_stage_definitions, add_stage_triples
 
 
+def _read_json(path: Path) -> dict:
+    """Read and parse one JSON cache file."""
+    return orjson.loads(path.read_bytes())
+
+
+# Invitation suffixes that mark a submission status; invitations are
+# structured IDs like "{venue_id}/-/Withdrawn_Submission".
+_STATUS_SUFFIXES = (
+    ("Withdrawn_Submission", "withdrawn"),
+    ("Desk_Rejected_Submission", "desk_rejected"),
+)
+
+# Free-text review fields and their precomputed predicates, emitted per
+# official review.
+_REVIEW_FIELDS = tuple(
+    (field, f":{field}")
+    for field in (
+        "strengths",
+        "weaknesses",
+        "detailed_comments",
+        "responsible_reviewing",
+        "ai_generated_content",
+        "review_and_resubmit",
+        "best_paper_award",
+    )
+)
+
+
 class DumpCommand(Command):
     """
     Output all cached data as RDF (for QLever import).
@@ -41,51 +75,101 @@ class DumpCommand(Command):
         groups_dir = Path(cache_dir) / "groups"
         all_groups = {}
         if groups_dir.exists():
-            for cache_file in groups_dir.glob("*.json"):
-                role_suffix = cache_file.stem  # e.g., "Reviewers"
-                with open(cache_file) as f:
-                    all_groups[role_suffix] = json.load(f)
+            cache_files = list(groups_dir.glob("*.json"))
+            with ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4)
+            ) as executor:
+                for cache_file, data in zip(
+                    cache_files, executor.map(_read_json, cache_files)
+                ):
+                    all_groups[cache_file.stem] = data  # stem is e.g. "Reviewers"
         return all_groups
 
     def _load_reduced_loads(self, cache_dir: str) -> dict[str, int]:
         """Load reduced loads from cache."""
         cache_path = Path(cache_dir) / "recruitment" / "reduced_loads.json"
         if cache_path.exists():
-            with open(cache_path) as f:
-                return json.load(f)
+            return orjson.loads(cache_path.read_bytes())
         return {}
 
-    def _load_submissions(self, cache_dir: str) -> list[dict]:
-        """Load all submissions from cache."""
+    def _load_submission_ids(self, cache_dir: str) -> set[str]:
+        """Collect all cached submission IDs from filenames, without parsing.
+        Submissions are cached as submissions/{submission_id}.json.
+        """
+        submissions_dir = Path(cache_dir) / "submissions"
+        if not submissions_dir.exists():
+            return set()
+        with os.scandir(submissions_dir) as entries:
+            return {
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith("_")
+            }
+
+    def _iter_submissions(self, cache_dir: str) -> Iterator[dict]:
+        """Yield parsed submissions from cache one at a time.
+        Reads are fanned out over a thread pool with a bounded window of
+        in-flight files, so peak memory stays at O(window) parsed
+        submissions instead of the whole cache.
+        """
         submissions_dir = Path(cache_dir) / "submissions"
-        submissions = []
-        if submissions_dir.exists():
-            for cache_file in submissions_dir.glob("*.json"):
-                # Skip metadata files
-                if cache_file.name.startswith("_"):
-                    continue
-                try:
-                    with open(cache_file) as f:
-                        submissions.append(json.load(f))
-                except Exception:
-                    pass
-        return submissions
+        if not submissions_dir.exists():
+            return
+        with os.scandir(submissions_dir) as entries:
+            paths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith("_")
+            ]
+        path_iter = iter(paths)
+        pending: deque = deque()
+        with ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        ) as executor:
+            for path in islice(path_iter, 64):
+                pending.append(executor.submit(self._read_submission, path))
+            while pending:
+                future = pending.popleft()
+                next_path = next(path_iter, None)
+                if next_path is not None:
+                    pending.append(executor.submit(self._read_submission, next_path))
+                data = future.result()
+                if data is not None:
+                    yield data
+
+    def _read_submission(self, cache_file: Path) -> dict | None:
+        """Read one submission cache file, returning None on parse errors.
+        A corrupt or unreadable file is logged instead of silently skipped.
+        """
+        try:
+            return orjson.loads(cache_file.read_bytes())
+        except (orjson.JSONDecodeError, OSError) as e:
+            log.warning(f"Skipping {cache_file}: {e}")
+            return None
 
     def _load_reversed_ids(self, cache_dir: str, filename: str) -> set[str]:
         """Load set of submission IDs from a reversions cache file."""
         cache_path = Path(cache_dir) / "submissions" / filename
         if cache_path.exists():
-            with open(cache_path) as f:
-                return set(json.load(f))
+            return set(orjson.loads(cache_path.read_bytes()))
         return set()
 
-    def _load_review(self, cache_dir: str, submission_id: str) -> dict | None:
-        """Load AI review from cache if available."""
-        review_path = Path(cache_dir) / "reviews" / f"{submission_id}.json"
-        if review_path.exists():
-            with open(review_path) as f:
-                return json.load(f)
-        return None
+    def _load_all_reviews(self, cache_dir: str) -> dict[str, dict]:
+        """Load all AI reviews from cache in one pass.
+        Returns dict: submission_id -> review_dict
+        """
+        reviews_dir = Path(cache_dir) / "reviews"
+        all_reviews = {}
+        if reviews_dir.exists():
+            cache_files = list(reviews_dir.glob("*.json"))
+            with ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4)
+            ) as executor:
+                for cache_file, data in zip(
+                    cache_files, executor.map(_read_json, cache_files)
+                ):
+                    all_reviews[cache_file.stem] = data
+        return all_reviews
 
     def _load_official_reviews(self, cache_dir: str) -> dict[str, list[dict]]:
         """Load official reviews from cache.
@@ -93,8 +177,7 @@ class DumpCommand(Command):
         """
         cache_path = Path(cache_dir) / "official_reviews.json"
         if cache_path.exists():
-            with open(cache_path) as f:
-                return json.load(f)
+            return orjson.loads(cache_path.read_bytes())
         return {}
 
     def _load_stage_responses(self, cache_dir: str, stage_name: str) -> dict[str, dict]:
@@ -105,8 +188,7 @@ class DumpCommand(Command):
         cache_filename = stage_name.lower() + ".json"
         cache_path = Path(cache_dir) / "tasks" / cache_filename
         if cache_path.exists():
-            with open(cache_path) as f:
-                return json.load(f)
+            return orjson.loads(cache_path.read_bytes())
         return {}
 
     def _load_assignments(self, cache_dir: str) -> dict[str, list[str]]:
@@ -115,21 +197,18 @@ class DumpCommand(Command):
         Handles both old format (list of strings) and new format (list of dicts).
         """
         assignments_dir = Path(cache_dir) / "assignments"
-        all_assignments: dict[str, list[str]] = {}
+        all_assignments: defaultdict[str, list[str]] = defaultdict(list)
 
         for cache_file in ["senior_area_chairs.json", "area_chairs.json", "reviewers.json"]:
             cache_path = assignments_dir / cache_file
             if cache_path.exists():
-                with open(cache_path) as f:
-                    data = json.load(f)
-                    for submission_id, assignees in data.items():
-                        if submission_id not in all_assignments:
-                            all_assignments[submission_id] = []
-                        for a in assignees:
-                            pid = a["profile_id"] if isinstance(a, dict) else a
-                            all_assignments[submission_id].append(pid)
+                data = orjson.loads(cache_path.read_bytes())
+                for submission_id, assignees in data.items():
+                    for a in assignees:
+                        pid = a["profile_id"] if isinstance(a, dict) else a
+                        all_assignments[submission_id].append(pid)
 
-        return all_assignments
+        return dict(all_assignments)
 
     def _get_rdf_class(self, role_suffix: str) -> str:
         """Get RDF class name for a role suffix."""
@@ -178,29 +257,22 @@ class DumpCommand(Command):
             all_members = confirmed | invited | declined
             all_member_ids.update(all_members)
 
-            # First pass: resolve all member IDs to canonical profile IDs
-            # and collect all identifiers for each person
-            canonical_profiles: dict[str, dict] = {}  # canonical_id -> member_info
-            canonical_to_original: dict[
-                str, set
-            ] = {}  # canonical_id -> set of original IDs
+            # First pass: resolve member IDs to canonical profile IDs via the
+            # cheap alias mapping (no profile loads) and collect the original
+            # identifiers per person
+            # canonical_id -> set of original IDs
+            canonical_to_original: defaultdict[str, set] = defaultdict(set)
 
             for member_id in all_members:
-                profile_with_papers.get_profile(member_id)
-                member_info = profile_with_papers.asJson()
-                canonical_id = member_info.get("id", member_id)
-
-                # Store profile info (may overwrite, but same profile)
-                canonical_profiles[canonical_id] = member_info
-
-                # Track all original member IDs that resolved to this canonical ID
-                if canonical_id not in canonical_to_original:
-                    canonical_to_original[canonical_id] = set()
+                canonical_id = profile_with_papers.resolve_id(member_id)
                 canonical_to_original[canonical_id].add(member_id)
 
-            # Second pass: determine status for each canonical profile
+            # Second pass: load each canonical profile exactly once (instead
+            # of once per alias) and determine its status.
             # A person is confirmed/declined if ANY of their identifiers are
-            for canonical_id, member_info in canonical_profiles.items():
+            for canonical_id in canonical_to_original:
+                profile_with_papers.get_profile(canonical_id)
+                member_info = profile_with_papers.asJson()
                 # Get all identifiers for this person:
                 # canonical ID + emails + all original IDs that resolved here
                 person_identifiers = {canonical_id}
@@ -227,13 +299,13 @@ class DumpCommand(Command):
                     rdf.add_triple(person_iri, ":role_invited", rdf_class)
                 rdf.add_triple(person_iri, ":status", rdf.literal(status))
 
-                # Add reduced_load if present (match by email)
+                # Add reduced_load if present (match by email; dict.get is a
+                # single hash per email, and no intermediate set is built)
                 member_emails = member_info.get("content", {}).get("emails", [])
                 for email in member_emails:
-                    if email in reduced_loads:
-                        rdf.add_triple(
-                            person_iri, ":reduced_load", str(reduced_loads[email])
-                        )
+                    reduced_load = reduced_loads.get(email)
+                    if reduced_load is not None:
+                        rdf.add_triple(person_iri, ":reduced_load", str(reduced_load))
                         break
 
                 # Add profile data
@@ -252,13 +324,14 @@ class DumpCommand(Command):
         self,
         rdf: Rdf,
         args: Namespace,
-        submissions: list[dict],
+        submissions: Iterable[dict],
         profile_with_papers: ProfileWithPapers,
         submission_ids: set[str],
         processed_publications: set[str],
         processed_persons: set[str],
         reversed_withdrawals: set[str],
         reversed_desk_rejections: set[str],
+        all_reviews: dict[str, dict],
     ) -> tuple[set[str], set[str]]:
         """
         Add RDF triples for all submissions.
@@ -267,6 +340,10 @@ class DumpCommand(Command):
         all_author_ids = set()
         all_author_reviewer_ids = set()
 
+        # resolve_id is a plain dict lookup; bind it once so the hot loop
+        # avoids a per-call attribute resolution.
+        resolve_id = profile_with_papers.resolve_id
+
         for submission in submissions:
             submission_id = submission["id"]
             submission_iri = rdf.paperIri(submission_id)
@@ -281,12 +358,16 @@ class DumpCommand(Command):
             # ddate = deletion date (soft delete, shown as greyed out in UI)
             # Check reversed_withdrawals/reversed_desk_rejections for reversions
             invitations = submission.get("invitations", [])
-            has_withdrawn_inv = any(
-                "Withdrawn_Submission" in inv for inv in invitations
-            )
-            has_desk_rejected_inv = any(
-                "Desk_Rejected_Submission" in inv for inv in invitations
-            )
+            # Classify in a single pass via suffix checks on the structured
+            # invitation IDs (no per-marker rescans or joined copies).
+            statuses = {
+                status
+                for inv in invitations
+                for suffix, status in _STATUS_SUFFIXES
+                if inv.endswith(suffix)
+            }
+            has_withdrawn_inv = "withdrawn" in statuses
+            has_desk_rejected_inv = "desk_rejected" in statuses
             withdrawal_reversed = submission_id in reversed_withdrawals
             desk_rejection_reversed = submission_id in reversed_desk_rejections
 
@@ -306,7 +387,7 @@ class DumpCommand(Command):
 
             desk_rejected_by = submission.get("desk_rejected_by", "")
             if desk_rejected_by:
-                desk_rejected_by_id = profile_with_papers.resolve_id(desk_rejected_by)
+                desk_rejected_by_id = resolve_id(desk_rejected_by)
                 rdf.add_triple(
                     submission_iri,
                     ":desk_rejected_by",
@@ -327,12 +408,16 @@ class DumpCommand(Command):
             )
 
             author_ids_raw = rdf.valuesFromJson(content, "authorids.value")
-            # Resolve aliases to canonical IDs
-            author_ids = [profile_with_papers.resolve_id(aid) for aid in author_ids_raw]
-            for author_id in author_ids:
-                rdf.add_triple(submission_iri, ":author", rdf.personIri(author_id))
+            # Resolve aliases to canonical IDs, emit the author triples, and
+            # collect the resolved IDs in a single pass
+            author_ids = []
+            for author_id_raw in author_ids_raw:
+                author_id = resolve_id(author_id_raw)
+                author_iri = rdf.personIri(author_id)
+                rdf.add_triple(submission_iri, ":author", author_iri)
                 # Also add reverse :publication triple so submissions appear in author's publications
-                rdf.add_triple(rdf.personIri(author_id), ":publication", submission_iri)
+                rdf.add_triple(author_iri, ":publication", submission_iri)
+                author_ids.append(author_id)
                 all_author_ids.add(author_id)
 
             # Add comma-separated author IDs and names
@@ -353,9 +438,7 @@ class DumpCommand(Command):
                 "value", ""
             )
             if author_reviewer_id_raw:
-                author_reviewer_id = profile_with_papers.resolve_id(
-                    author_reviewer_id_raw
-                )
+                author_reviewer_id = resolve_id(author_reviewer_id_raw)
                 rdf.add_triple(
                     submission_iri,
                     ":author_reviewer",
@@ -378,7 +461,7 @@ class DumpCommand(Command):
             rdf.add_triple(submission_iri, ":has_pdf", "true" if has_pdf else "false")
 
             # Add AI review triples
-            review = self._load_review(args.cache_dir, submission["id"]) or {}
+            review = all_reviews.get(submission_id, {})
             rdf.add_triple(
                 submission_iri,
                 ":ai_summary",
@@ -453,7 +536,9 @@ class DumpCommand(Command):
         # Load all cached data
         all_groups = self._load_groups(args.cache_dir)
         reduced_loads = self._load_reduced_loads(args.cache_dir)
-        submissions = self._load_submissions(args.cache_dir)
+        # Submission IDs come from a cheap filename scan; the submissions
+        # themselves are streamed one at a time during triple emission.
+        submission_ids = self._load_submission_ids(args.cache_dir)
         reversed_withdrawals = self._load_reversed_ids(
             args.cache_dir, "_reversed_withdrawals.json"
         )
@@ -462,7 +547,7 @@ class DumpCommand(Command):
         )
         stage_definitions = get_all_stage_definitions()
 
-        if not all_groups and not submissions:
+        if not all_groups and not submission_ids:
             log.error("No cached data. Run 'ortler update' first.")
             return
 
@@ -471,126 +556,119 @@ class DumpCommand(Command):
             cache_dir=args.cache_dir, cache_only=True
         )
 
-        rdf = Rdf()
-
-        # Extract submission IDs and create shared tracking sets
-        submission_ids = {s["id"] for s in submissions}
-        processed_publications: set[str] = set()
-        processed_persons: set[str] = set()
-
-        # Add recruitment triples
-        if all_groups:
-            member_count = sum(
-                len(set().union(*[set(g.get("members", [])) for g in groups.values()]))
-                for groups in all_groups.values()
-            )
-            log.info(f"Adding triples for {member_count} committee members...")
-            self._add_recruitment_triples(
-                rdf,
-                args,
-                all_groups,
-                reduced_loads,
-                profile_with_papers,
-                submission_ids,
-                processed_publications,
-                processed_persons,
-            )
+        # Stream triples directly to the output file (or stdout) instead of
+        # materializing the whole graph in memory first.
+        with Rdf.open_stream(args.output) as rdf:
+            # Create shared tracking sets
+            processed_publications: set[str] = set()
+            processed_persons: set[str] = set()
+
+            # Add recruitment triples
+            if all_groups:
+                member_count = sum(
+                    len({m for g in groups.values() for m in g.get("members", [])})
+                    for groups in all_groups.values()
+                )
+                log.info(f"Adding triples for {member_count} committee members...")
+                self._add_recruitment_triples(
+                    rdf,
+                    args,
+                    all_groups,
+                    reduced_loads,
+                    profile_with_papers,
+                    submission_ids,
+                    processed_publications,
+                    processed_persons,
+                )
 
-        # Add submission triples
-        if submissions:
-            log.info(f"Adding triples for {len(submissions)} submissions...")
-            self._add_submission_triples(
-                rdf,
-                args,
-                submissions,
-                profile_with_papers,
-                submission_ids,
-                processed_publications,
-                processed_persons,
-                reversed_withdrawals,
-                reversed_desk_rejections,
-            )
+            # Add submission triples
+            if submission_ids:
+                log.info(f"Adding triples for {len(submission_ids)} submissions...")
+                self._add_submission_triples(
+                    rdf,
+                    args,
+                    self._iter_submissions(args.cache_dir),
+                    profile_with_papers,
+                    submission_ids,
+                    processed_publications,
+                    processed_persons,
+                    reversed_withdrawals,
+                    reversed_desk_rejections,
+                    self._load_all_reviews(args.cache_dir),
+                )
 
-        # Add assignment triples
-        assignments = self._load_assignments(args.cache_dir)
-        if assignments:
-            assignment_count = sum(len(v) for v in assignments.values())
-            log.info(f"Adding triples for {assignment_count} assignments...")
-            for submission_id, assignees in assignments.items():
-                paper_iri = rdf.paperIri(submission_id)
-                for assignee in assignees:
-                    rdf.add_triple(paper_iri, ":assigned", rdf.personIri(assignee))
-
-        # Add official review triples
-        official_reviews = self._load_official_reviews(args.cache_dir)
-        if official_reviews:
-            review_count = sum(len(v) for v in official_reviews.values())
-            log.info(f"Adding triples for {review_count} official reviews...")
-            for submission_id, reviews in official_reviews.items():
-                paper_iri = rdf.paperIri(submission_id)
-                for review in reviews:
-                    reviewer_id = review.get("_reviewer", "")
-                    if not reviewer_id:
-                        continue
-                    review_iri = rdf.reviewIri(submission_id, reviewer_id)
-                    rdf.add_triple(paper_iri, ":has_review", review_iri)
-                    rdf.add_triple(review_iri, ":reviewer", rdf.personIri(reviewer_id))
-                    rdf.add_triple(review_iri, "a", ":Review")
-                    rating = review.get("rating")
-                    if rating is not None:
-                        rdf.add_triple(review_iri, ":rating", str(rating))
-                    confidence = review.get("confidence")
-                    if confidence is not None:
-                        rdf.add_triple(review_iri, ":confidence", str(confidence))
-                    tcdate = review.get("tcdate")
-                    if tcdate is not None:
-                        rdf.add_triple(
-                            review_iri, ":cdate", rdf.dateFromTimestamp(tcdate)
-                        )
-                        rdf.add_triple(
-                            review_iri, ":cdatetime", rdf.dateTimeFromTimestamp(tcdate)
-                        )
-                    tmdate = review.get("tmdate")
-                    if tmdate is not None:
-                        rdf.add_triple(
-                            review_iri, ":mdate", rdf.dateFromTimestamp(tmdate)
-                        )
+            # Add assignment triples
+            assignments = self._load_assignments(args.cache_dir)
+            if assignments:
+                assignment_count = sum(len(v) for v in assignments.values())
+                log.info(f"Adding triples for {assignment_count} assignments...")
+                for submission_id, assignees in assignments.items():
+                    paper_iri = rdf.paperIri(submission_id)
+                    for assignee in assignees:
+                        rdf.add_triple(paper_iri, ":assigned", rdf.personIri(assignee))
+
+            # Add official review triples
+            official_reviews = self._load_official_reviews(args.cache_dir)
+            if official_reviews:
+                review_count = sum(len(v) for v in official_reviews.values())
+                log.info(f"Adding triples for {review_count} official reviews...")
+                for submission_id, reviews in official_reviews.items():
+                    paper_iri = rdf.paperIri(submission_id)
+                    for review in reviews:
+                        reviewer_id = review.get("_reviewer", "")
+                        if not reviewer_id:
+                            continue
+                        review_iri = rdf.reviewIri(submission_id, reviewer_id)
+                        rdf.add_triple(paper_iri, ":has_review", review_iri)
                         rdf.add_triple(
-                            review_iri, ":mdatetime", rdf.dateTimeFromTimestamp(tmdate)
+                            review_iri, ":reviewer", rdf.personIri(reviewer_id)
                         )
-                    for field in [
-                        "strengths",
-                        "weaknesses",
-                        "detailed_comments",
-                        "responsible_reviewing",
-                        "ai_generated_content",
-                        "review_and_resubmit",
-                        "best_paper_award",
-                    ]:
-                        value = review.get(field)
-                        if value is not None:
-                            rdf.add_triple(review_iri, f":{field}", rdf.literal(str(value)))
-
-        # Add custom stage response triples (deduplicate by stage name)
-        seen_stages: set[str] = set()
-        for stage_def in stage_definitions:
-            stage_name = stage_def.get("name", "")
-            if stage_name in seen_stages:
-                continue
-            seen_stages.add(stage_name)
-            responses = self._load_stage_responses(args.cache_dir, stage_name)
-            if responses:
-                log.info(
-                    f"Adding triples for {len(responses)} {stage_name} responses..."
-                )
-                add_stage_triples(rdf, stage_def, responses)
-
-        # Output
-        output_content = rdf.as_turtle()
+                        rdf.add_triple(review_iri, "a", ":Review")
+                        rating = review.get("rating")
+                        if rating is not None:
+                            rdf.add_triple(review_iri, ":rating", str(rating))
+                        confidence = review.get("confidence")
+                        if confidence is not None:
+                            rdf.add_triple(review_iri, ":confidence", str(confidence))
+                        tcdate = review.get("tcdate")
+                        if tcdate is not None:
+                            rdf.add_triple(
+                                review_iri, ":cdate", rdf.dateFromTimestamp(tcdate)
+                            )
+                            rdf.add_triple(
+                                review_iri,
+                                ":cdatetime",
+                                rdf.dateTimeFromTimestamp(tcdate),
+                            )
+                        tmdate = review.get("tmdate")
+                        if tmdate is not None:
+                            rdf.add_triple(
+                                review_iri, ":mdate", rdf.dateFromTimestamp(tmdate)
+                            )
+                            rdf.add_triple(
+                                review_iri,
+                                ":mdatetime",
+                                rdf.dateTimeFromTimestamp(tmdate),
+                            )
+                        for field, predicate in _REVIEW_FIELDS:
+                            value = review.get(field)
+                            if value is not None:
+                                rdf.add_triple(
+                                    review_iri, predicate, rdf.literal(str(value))
+                                )
+
+            # Add custom stage response triples (deduplicate by stage name,
+            # keeping the first definition for each name)
+            unique_stages: dict[str, dict] = {}
+            for stage_def in stage_definitions:
+                unique_stages.setdefault(stage_def.get("name", ""), stage_def)
+            for stage_name, stage_def in unique_stages.items():
+                responses = self._load_stage_responses(args.cache_dir, stage_name)
+                if responses:
+                    log.info(
+                        f"Adding triples for {len(responses)} {stage_name} responses..."
+                    )
+                    add_stage_triples(rdf, stage_def, responses)
 
         if args.output:
-            with open(args.output, "w") as f:
-                f.write(output_content)
             log.info(f"RDF saved to {args.output}")
-        else:
-            print(output_content)
@@ -6,16 +6,48 @@ import os
 import random
 import re
 from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote
 
-from ..command import Command
 from ..client import get_client
+from ..command import Command
 from ..log import log
 from ..qlever import query_results_by_recipient
 from ..utils import format_author_name
 
+# Placeholder syntax used in mail bodies and --write-to-file paths.
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+@lru_cache(maxsize=1024)
+def _parse_address(header: str) -> dict:
+    """
+    Parse an address header into a dict with fromName and fromEmail.
+    Handles formats like: "Name <email>" or just "email". Memoized, since
+    the same From and repeated To/Cc addresses are parsed many times.
+    """
+    header = header.strip()
+    # Common case: bare email or profile ID, no display name
+    if "<" not in header:
+        return {"fromName": "", "fromEmail": header}
+    name, _, rest = header.partition("<")
+    email, _, _ = rest.partition(">")
+    return {"fromName": name.strip(), "fromEmail": email.strip()}
+
+
+@lru_cache(maxsize=8)
+def _split_template(body: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Tokenize a template into literal chunks and placeholder names.
+    The body is identical across all recipients of a mailing, so the
+    split runs once (cached) and personalization is a plain join.
+    """
+    parts = _PLACEHOLDER_RE.split(body)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
 
 class MailCommand(Command):
     """
@@ -73,7 +105,7 @@ class MailCommand(Command):
         Get the name from a profile: first name if available, otherwise full name,
         otherwise extract from profile ID.
         """
-        content = profile.content if hasattr(profile, "content") else {}
+        content = getattr(profile, "content", None) or {}
         names = content.get("names", [])
         if names:
             first_name = names[0].get("first")
@@ -83,22 +115,60 @@ class MailCommand(Command):
             if fullname:
                 return fullname
         # Fallback: extract name from profile ID (e.g., ~K__J__Amala1 -> K J Amala)
-        if hasattr(profile, "id") and profile.id:
-            return format_author_name(profile.id)
+        profile_id = getattr(profile, "id", None)
+        if profile_id:
+            return format_author_name(profile_id)
         return ""
 
     def _parse_from_header(self, from_header: str) -> dict:
         """
         Parse From header into sender dict with fromName and fromEmail.
-        Handles formats like: "Name <email>" or just "email"
         """
-        match = re.match(r"(.+?)\s*<(.+?)>", from_header)
-        if match:
-            return {
-                "fromName": match.group(1).strip(),
-                "fromEmail": match.group(2).strip(),
-            }
-        return {"fromName": "", "fromEmail": from_header.strip()}
+        return _parse_address(from_header)
+
+    def _prefetch_names(self, client, recipients: list[str]) -> dict[str, str]:
+        """
+        Fetch display names for all recipients in a few bulk search_profiles
+        calls (chunks of 100) instead of one get_profile round-trip each.
+        Returns dict: recipient ID/email -> name. Recipients missing from
+        the result simply aren't in the dict.
+        """
+        unique_recipients = list(dict.fromkeys(recipients))
+        profile_ids = [r for r in unique_recipients if r.startswith("~")]
+        emails = [r for r in unique_recipients if "@" in r]
+        name_by_id: dict[str, str] = {}
+
+        for start in range(0, len(profile_ids), 100):
+            chunk = profile_ids[start : start + 100]
+            try:
+                profiles = client.search_profiles(ids=chunk)
+            except Exception as e:
+                log.warning(f"Failed to batch fetch profiles: {e}")
+                continue
+            for profile in profiles:
+                name = self._get_name(profile)
+                name_by_id[profile.id] = name
+                # Also index alias usernames (merged/renamed profiles):
+                # a recipient addressed by an old ID gets the canonical
+                # profile back, keyed by the canonical ID only.
+                content = getattr(profile, "content", None) or {}
+                for name_entry in content.get("names", []):
+                    username = name_entry.get("username")
+                    if username:
+                        name_by_id.setdefault(username, name)
+
+        for start in range(0, len(emails), 100):
+            chunk = emails[start : start + 100]
+            try:
+                email_results = client.search_profiles(emails=chunk)
+            except Exception as e:
+                log.warning(f"Failed to batch fetch profiles by email: {e}")
+                continue
+            for email, profiles in email_results.items():
+                if profiles:
+                    name_by_id[email] = self._get_name(profiles[0])
+
+        return name_by_id
 
     def _personalize_body(
         self,
@@ -106,33 +176,31 @@ class MailCommand(Command):
         placeholders: set[str],
         recipient: str,
         row_data: dict | None,
-        client,
+        name_by_id: dict[str, str],
     ) -> str:
         """
         Substitute placeholders in the body for a specific recipient.
+        The body is tokenized once (cached) into literals and variable
+        names, so each recipient only pays for the value lookups and a
+        join; unknown placeholders are left verbatim, as before.
         """
-        personalized_body = body
+        literals, variables = _split_template(body)
+        if not variables:
+            return body
 
-        # Substitute {{name}} from profile if present
+        row = dict(row_data) if row_data else {}
         if "name" in placeholders:
-            try:
-                profile = client.get_profile(recipient)
-                name = self._get_name(profile)
-            except Exception:
+            name = name_by_id.get(recipient)
+            if name is None:
                 # Profile not found - extract name from recipient ID
                 name = format_author_name(recipient)
-            personalized_body = personalized_body.replace(
-                "{{name}}", name if name else ""
-            )
-
-        # Substitute query variables if available
-        if row_data:
-            for var, value in row_data.items():
-                personalized_body = personalized_body.replace(
-                    "{{" + var + "}}", value if value else ""
-                )
+            row["name"] = name
 
-        return personalized_body
+        chunks = [literals[0]]
+        for var, literal in zip(variables, literals[1:]):
+            chunks.append((row[var] or "") if var in row else "{{" + var + "}}")
+            chunks.append(literal)
+        return "".join(chunks)
 
     def _generate_mbox(
         self,
@@ -141,7 +209,7 @@ class MailCommand(Command):
         body: str,
         placeholders: set[str],
         data_per_row: list[dict],
-        client,
+        name_by_id: dict[str, str],
     ) -> str:
         """
         Generate mbox content for all emails that will be sent.
@@ -155,7 +223,7 @@ class MailCommand(Command):
             if placeholders:
                 row_data = data_per_row[i] if i < len(data_per_row) else None
                 email_body = self._personalize_body(
-                    body, placeholders, recipient, row_data, client
+                    body, placeholders, recipient, row_data, name_by_id
                 )
             else:
                 email_body = body
@@ -181,38 +249,25 @@ class MailCommand(Command):
         with open(args.file, "r") as f:
             content = f.read()
 
-        # Extract and preserve comment lines, check for # Query: comment
+        # Extract and preserve the leading comment block, check for
+        # # Query: comment; one regex match instead of splitting the whole
+        # file into lines and rejoining it
         query_from_file = None
-        content_lines = content.split("\n")
-        comment_lines = []
-        while content_lines and content_lines[0].strip().startswith("#"):
-            line = content_lines.pop(0)
-            comment_lines.append(line)
-            if line.strip().startswith("# Query:"):
-                query_from_file = line.strip()[8:].strip()
-        content = "\n".join(content_lines)
+        comment_match = re.match(r"(?:[ \t]*#[^\n]*\n?)*", content)
+        comment_block = content[: comment_match.end()]
+        content = content[comment_match.end() :]
+        comment_lines = comment_block.splitlines()
+        query_match = re.search(r"^[ \t]*# Query:(.*)", comment_block, re.MULTILINE)
+        if query_match:
+            query_from_file = query_match.group(1).strip()
 
         # Use query from file if no command-line argument was given
         query_hash_or_url = args.recipients_from_sparql_query or query_from_file
 
-        # Replace To: recipients from SPARQL query if requested
-        data_per_row: list[dict] = []
-        if query_hash_or_url:
-            if query_from_file and not args.recipients_from_sparql_query:
-                log.info(f"Using query from file: {query_from_file}")
-
-            if not content.startswith("To:"):
-                log.error(
-                    "Mail file must start with 'To:' (after any # comments) "
-                    "when using a SPARQL query for recipients"
-                )
-                return
-            query_recipients, data_per_row = query_results_by_recipient(
-                query_hash_or_url
-            )
-            new_to_line = "To: " + ", ".join(query_recipients)
-            # Replace the first line (To: ...) with the new recipients
-            content = new_to_line + content[content.index("\n") :]
+        # Split off the To: line once; the remainder is reused for every
+        # later recipient-line rewrite instead of re-searching the full
+        # content for the first newline
+        first_line, _, content_rest = content.partition("\n")
 
         # Split headers and body (separated by blank line)
         parts = content.split("\n\n", 1)
@@ -227,6 +282,55 @@ class MailCommand(Command):
         # Clean up body: remove trailing empty lines
         body = body.rstrip()
 
+        # Parse headers: one partition per line instead of a containment
+        # scan followed by a split over the same characters
+        headers = {}
+        for line in headers_section.strip().split("\n"):
+            key, sep, value = line.partition(":")
+            if sep:
+                headers[key.strip()] = value.strip()
+
+        # Validate everything local before any network round-trip, so a
+        # misconfigured mail file fails fast instead of after the SPARQL
+        # query has already been issued
+        if query_hash_or_url and not first_line.startswith("To:"):
+            log.error(
+                "Mail file must start with 'To:' (after any # comments) "
+                "when using a SPARQL query for recipients"
+            )
+            return
+        if not args.write_to_file:
+            if "To" not in headers:
+                log.error("Missing required header: To")
+                return
+            if "Subject" not in headers:
+                log.error("Missing required header: Subject")
+                return
+            # Get From header from file or environment
+            if "From" not in headers:
+                from_env = os.environ.get("MAIL_FROM")
+                if from_env:
+                    headers["From"] = from_env
+                else:
+                    log.error(
+                        "Missing required header: From (set in file or $MAIL_FROM)"
+                    )
+                    return
+
+        # Replace To: recipients from SPARQL query if requested
+        data_per_row: list[dict] = []
+        if query_hash_or_url:
+            if query_from_file and not args.recipients_from_sparql_query:
+                log.info(f"Using query from file: {query_from_file}")
+
+            query_recipients, data_per_row = query_results_by_recipient(
+                query_hash_or_url
+            )
+            to_value = ", ".join(query_recipients)
+            headers["To"] = to_value
+            # Replace the first line (To: ...) with the new recipients
+            content = "To: " + to_value + "\n" + content_rest
+
         # Write-to-file mode: write personalized files instead of sending email
         if args.write_to_file:
             if not query_hash_or_url:
@@ -236,11 +340,16 @@ class MailCommand(Command):
                 )
                 return
 
-            placeholder_pattern = re.compile(r"\{\{(\w+)\}\}")
-            placeholders = set(placeholder_pattern.findall(body))
-            path_placeholders = set(placeholder_pattern.findall(args.write_to_file))
+            placeholders = set(_PLACEHOLDER_RE.findall(body))
+            path_placeholders = set(_PLACEHOLDER_RE.findall(args.write_to_file))
             all_placeholders = placeholders | path_placeholders
 
+            name_by_id = (
+                self._prefetch_names(client, query_recipients)
+                if "name" in all_placeholders
+                else {}
+            )
+
             written = 0
             for i, recipient in enumerate(query_recipients):
                 row_data = data_per_row[i] if i < len(data_per_row) else {}
@@ -250,7 +359,7 @@ class MailCommand(Command):
                     all_placeholders,
                     recipient,
                     row_data,
-                    client,
+                    name_by_id,
                 )
 
                 # Resolve filename templates
@@ -269,30 +378,6 @@ class MailCommand(Command):
             log.info(f"Wrote {written} files")
             return
 
-        # Parse headers
-        headers = {}
-        for line in headers_section.strip().split("\n"):
-            if ":" in line:
-                key, value = line.split(":", 1)
-                headers[key.strip()] = value.strip()
-
-        # Validate required headers
-        if "To" not in headers:
-            log.error("Missing required header: To")
-            return
-        if "Subject" not in headers:
-            log.error("Missing required header: Subject")
-            return
-
-        # Get From header from file or environment
-        if "From" not in headers:
-            from_env = os.environ.get("MAIL_FROM")
-            if from_env:
-                headers["From"] = from_env
-            else:
-                log.error("Missing required header: From (set in file or $MAIL_FROM)")
-                return
-
         # Parse sender - only use if email ends with @openreview.net
         parsed_sender = self._parse_from_header(headers["From"])
         if parsed_sender["fromEmail"].endswith("@openreview.net"):
@@ -315,14 +400,15 @@ class MailCommand(Command):
             data_per_row = [data_per_row[i] for i in indices] if data_per_row else []
             sampled = True
 
-        # Write updated content back to file (with sampled recipients if applicable)
+        # Write updated content back to file (with sampled recipients if
+        # applicable); a dry run keeps the expanded content in memory only
         if query_hash_or_url:
-            new_to_line = "To: " + ", ".join(original_recipients)
-            content = new_to_line + content[content.index("\n") :]
-            with open(args.file, "w") as f:
-                if comment_lines:
-                    f.write("\n".join(comment_lines) + "\n")
-                f.write(content)
+            content = "To: " + ", ".join(original_recipients) + "\n" + content_rest
+            if not args.dry_run:
+                with open(args.file, "w") as f:
+                    if comment_lines:
+                        f.write("\n".join(comment_lines) + "\n")
+                    f.write(content)
 
         # For test-run, redirect all emails to the test profile
         if args.test_run:
@@ -346,8 +432,7 @@ class MailCommand(Command):
 
         # Check if personalization is needed
         # Find all {{variable}} placeholders in the body
-        placeholder_pattern = re.compile(r"\{\{(\w+)\}\}")
-        placeholders = set(placeholder_pattern.findall(body))
+        placeholders = set(_PLACEHOLDER_RE.findall(body))
         needs_personalization = bool(placeholders)
 
         # Show what we're sending
@@ -378,6 +463,13 @@ class MailCommand(Command):
             )
             return
 
+        # Fetch all names needed for personalization in a few bulk calls
+        name_by_id = (
+            self._prefetch_names(client, original_recipients)
+            if "name" in placeholders
+            else {}
+        )
+
         # Generate mbox file with all emails (templates resolved)
         mbox_content = self._generate_mbox(
             original_recipients,
@@ -385,7 +477,7 @@ class MailCommand(Command):
             body,
             placeholders,
             data_per_row,
-            client,
+            name_by_id,
         )
         mail_path = Path(args.file)
         mbox_path = mail_path.with_suffix(".mbox")
@@ -411,18 +503,21 @@ class MailCommand(Command):
         sent_count = 0
         failed_count = 0
         if needs_personalization:
-            # Send individual personalized messages
+            # Send individual personalized messages concurrently; each
+            # post_message is a blocking HTTPS round-trip, so overlapping a
+            # bounded number of sends makes the batch throughput-bound
+            # instead of latency-bound.
             # Use original_recipients for data lookup, recipients for actual sending
-            for i, original_recipient in enumerate(original_recipients):
+            def send_one(i: int) -> bool:
                 send_to = recipients[i]
                 row_data = data_per_row[i] if i < len(data_per_row) else None
 
                 personalized_body = self._personalize_body(
                     body,
                     placeholders,
-                    original_recipient,
+                    original_recipients[i],
                     row_data,
-                    client,
+                    name_by_id,
                 )
 
                 try:
@@ -435,10 +530,15 @@ class MailCommand(Command):
                         sender=sender,
                         replyTo=reply_to,
                     )
-                    sent_count += 1
+                    return True
                 except Exception as e:
                     log.warning(f"Failed to send to {send_to}: {e}")
-                    failed_count += 1
+                    return False
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(send_one, range(len(original_recipients))))
+            sent_count = sum(results)
+            failed_count = len(results) - sent_count
         else:
             # Send single message to all To recipients
             try:
@@ -483,14 +583,22 @@ class MailCommand(Command):
                     f"compute the list of recipients]({query_hash_or_url})"
                 )
 
-            fyi_body = (
-                f"FYI, the mail below was sent to {num_recipients}: "
-                f"{headers.get('To')}"
-                f"{query_link_line}\n\n"
-                f"[Click here to see all messages with that subject in the OpenReview message log]({message_log_url})"
-                f"{self.separator}\n\n"
-                f"{body}"
-                f"{self.separator}"
+            # Join the pieces in one pass; the (possibly large) body is
+            # referenced, not copied into intermediate concatenations
+            fyi_body = "".join(
+                [
+                    f"FYI, the mail below was sent to {num_recipients}: ",
+                    headers.get("To", ""),
+                    query_link_line,
+                    (
+                        "\n\n[Click here to see all messages with that subject "
+                        f"in the OpenReview message log]({message_log_url})"
+                    ),
+                    self.separator,
+                    "\n\n",
+                    body,
+                    self.separator,
+                ]
             )
 
             try:
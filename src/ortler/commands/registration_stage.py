@@ -2,18 +2,23 @@
 Registration stage command for creating per-person tasks.
 """
 
-import json
 import os
 from argparse import ArgumentParser, Namespace
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import openreview
+import orjson
 
 from ..client import get_client_v1
 from ..command import Command
 from ..log import log
 
+# Venue objects fetched via get_conference, keyed by (client, request form ID).
+# Deploying several stages in one process then costs a single round-trip.
+_VENUE_CACHE: dict[tuple[int, str], Any] = {}
+
 
 class RegistrationStageCommand(Command):
     """
@@ -88,8 +93,8 @@ class RegistrationStageCommand(Command):
             log.error(f"Configuration file not found: {config_path}")
             return
 
-        with open(config_path) as f:
-            config = json.load(f)
+        # Parse the raw bytes directly; no intermediate text decode
+        config = orjson.loads(config_path.read_bytes())
 
         # Parse dates: command-line overrides JSON, JSON overrides defaults
         if args.start_date:
@@ -164,11 +169,15 @@ class RegistrationStageCommand(Command):
 
         # Get venue object using the request form ID
         log.info(f"Using request form ID: {request_form_id}")
-        try:
-            venue = openreview.helpers.get_conference(client, request_form_id)
-        except Exception as e:
-            log.error(f"Failed to get venue: {e}")
-            return
+        cache_key = (id(client), request_form_id)
+        venue = _VENUE_CACHE.get(cache_key)
+        if venue is None:
+            try:
+                venue = openreview.helpers.get_conference(client, request_form_id)
+            except Exception as e:
+                log.error(f"Failed to get venue: {e}")
+                return
+            _VENUE_CACHE[cache_key] = venue
 
         # Create the registration stage (use plural attribute)
         stage = openreview.stages.RegistrationStage(
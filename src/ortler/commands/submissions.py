@@ -2,11 +2,12 @@
 Submissions command for showing submission information.
 """
 
-import json
 from pathlib import Path
 
 from argparse import ArgumentParser, Namespace
 
+import orjson
+
 from ..command import Command
 from ..log import log
 
@@ -51,9 +52,11 @@ class SubmissionsCommand(Command):
 
         submissions_data = []
         for cache_file in submissions_cache_dir.glob("*.json"):
+            # Skip helper files like _index.json and _reversed_*.json
+            if cache_file.name.startswith("_"):
+                continue
             try:
-                with open(cache_file) as f:
-                    submissions_data.append(json.load(f))
+                submissions_data.append(orjson.loads(cache_file.read_bytes()))
             except Exception:
                 pass
 
@@ -2,13 +2,13 @@
 Submit command for submitting papers to OpenReview.
 """
 
-import json
 import os
 import sys
 from argparse import ArgumentParser, Namespace
 
 import numpy as np
 import openreview
+import orjson
 
 from ..command import Command
 from ..log import log
@@ -268,9 +268,9 @@ class SubmitCommand(Command):
 
             # Load JSON metadata
             try:
-                with open(json_path, "r") as f:
-                    metadata = json.load(f)
-            except json.JSONDecodeError as e:
+                with open(json_path, "rb") as f:
+                    metadata = orjson.loads(f.read())
+            except orjson.JSONDecodeError as e:
                 log.error(f"Invalid JSON in {json_path}: {e}")
                 failed += 1
                 continue
@@ -2,11 +2,16 @@
 Update command for incrementally syncing cache with OpenReview.
 """
 
-import json
+import os
+import queue
+import threading
 from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from ..command import Command
 from ..client import get_client
 from ..profile import ProfileWithPapers
@@ -14,6 +19,35 @@ from ..log import log
 from ..custom_stages import get_all_stage_definitions, fetch_stage_responses
 
 
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """
+    Write payload to path via a temp file and os.replace, so an
+    interrupted run never leaves a half-written cache file behind.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def _atomic_write_json(path: Path, obj) -> None:
+    """Serialize obj as indented JSON and write it atomically."""
+    _atomic_write(path, orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
+def _scan_json_files(directory: Path) -> list[Path]:
+    """
+    List the cache files (*.json, minus _-prefixed helper files) in a
+    directory. Uses os.scandir, which is noticeably faster than Path.glob
+    on directories with tens of thousands of entries.
+    """
+    with os.scandir(directory) as it:
+        return [
+            directory / entry.name
+            for entry in it
+            if entry.name.endswith(".json") and not entry.name.startswith("_")
+        ]
+
+
 class UpdateCommand(Command):
     """
     Incrementally update the cache with changes from OpenReview since the last update.
@@ -58,55 +92,117 @@ class UpdateCommand(Command):
         """Load cache metadata (including last_update_timestamp)."""
         metadata_path = self._get_metadata_path(cache_dir)
         if metadata_path.exists():
-            with open(metadata_path) as f:
-                return json.load(f)
+            return orjson.loads(metadata_path.read_bytes())
         return {}
 
     def _save_metadata(self, cache_dir: str, metadata: dict) -> None:
         """Save cache metadata."""
         metadata_path = self._get_metadata_path(cache_dir)
         metadata_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        _atomic_write_json(metadata_path, metadata)
+
+    # Lightweight per-submission metadata index so update helpers can scan
+    # one file instead of opening every submissions/*.json.
+    _INDEX_FILENAME = "_index.json"
+
+    @staticmethod
+    def _index_entry(submission: dict) -> dict:
+        """Project the fields the update logic needs from a submission."""
+        content = submission.get("content", {})
+        entry = {
+            "number": submission.get("number"),
+            "invitations": submission.get("invitations", []),
+            "authorids": content.get("authorids", {}).get("value", []),
+            "serve_as_reviewer": content.get("serve_as_reviewer", {}).get("value"),
+            "tmdate": submission.get("tmdate", 0),
+        }
+        if "desk_rejected_by" in submission:
+            entry["desk_rejected_by"] = submission["desk_rejected_by"]
+        return entry
+
+    def _load_submissions_index(self, args: Namespace) -> dict[str, dict]:
+        """
+        Load the submissions metadata index, rebuilding it from the
+        per-submission cache files when missing (one-shot migration).
+        """
+        submissions_cache_dir = Path(args.cache_dir) / "submissions"
+        index_path = submissions_cache_dir / self._INDEX_FILENAME
+        if index_path.exists():
+            try:
+                return orjson.loads(index_path.read_bytes())
+            except (orjson.JSONDecodeError, OSError) as e:
+                log.warning(f"Rebuilding unreadable submissions index: {e}")
 
-    def _get_tracked_profiles(self, args: Namespace, client) -> set[str]:
+        index: dict[str, dict] = {}
+        if not submissions_cache_dir.exists():
+            return index
+
+        def read_entry(cache_file: Path) -> tuple[str, dict] | None:
+            try:
+                submission = orjson.loads(cache_file.read_bytes())
+                return submission["id"], self._index_entry(submission)
+            except Exception:
+                return None
+
+        cache_files = _scan_json_files(submissions_cache_dir)
+        if cache_files:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for result in executor.map(read_entry, cache_files):
+                    if result:
+                        index[result[0]] = result[1]
+            log.info(f"Rebuilt submissions index with {len(index)} entries")
+        return index
+
+    def _save_submissions_index(self, args: Namespace, index: dict[str, dict]) -> None:
+        """Save the submissions metadata index."""
+        submissions_cache_dir = Path(args.cache_dir) / "submissions"
+        submissions_cache_dir.mkdir(parents=True, exist_ok=True)
+        index_path = submissions_cache_dir / self._INDEX_FILENAME
+        _atomic_write_json(index_path, index)
+
+    def _get_tracked_profiles(
+        self, args: Namespace, client, index: dict[str, dict]
+    ) -> set[str]:
         """
         Get all profile IDs we're tracking (from groups and submission authors).
         """
         tracked = set()
 
-        # Get members from recruitment groups
-        group_suffixes = ["Reviewers", "Area_Chairs", "Senior_Area_Chairs"]
-        for suffix in group_suffixes:
-            group_id = f"{args.venue_id}/{suffix}"
+        # Get members from recruitment groups; the three prefix fetches are
+        # independent API calls, so overlap them
+        def fetch_members(suffix: str) -> list[str]:
+            members: list[str] = []
             try:
-                groups = client.get_groups(prefix=group_id)
+                groups = client.get_groups(prefix=f"{args.venue_id}/{suffix}")
                 for group in groups:
-                    tracked.update(group.members or [])
+                    members.extend(group.members or [])
             except Exception:
                 pass
+            return members
 
-        # Get authors from submissions cache
-        submissions_cache_dir = Path(args.cache_dir) / "submissions"
-        if submissions_cache_dir.exists():
-            for cache_file in submissions_cache_dir.glob("*.json"):
-                try:
-                    with open(cache_file) as f:
-                        submission = json.load(f)
-                    content = submission.get("content", {})
-                    author_ids = content.get("authorids", {}).get("value", [])
-                    tracked.update(author_ids)
-                    # Also track author_reviewer (serve_as_reviewer field)
-                    author_reviewer = content.get("serve_as_reviewer", {}).get("value")
-                    if author_reviewer:
-                        tracked.add(author_reviewer)
-                except Exception:
-                    pass
+        group_suffixes = ["Reviewers", "Area_Chairs", "Senior_Area_Chairs"]
+        with ThreadPoolExecutor(max_workers=len(group_suffixes)) as executor:
+            for members in executor.map(fetch_members, group_suffixes):
+                tracked.update(members)
+
+        # Get authors (and serve_as_reviewer entries) from the submissions
+        # metadata index instead of re-reading every cached submission
+        for entry in index.values():
+            tracked.update(entry.get("authorids", []))
+            author_reviewer = entry.get("serve_as_reviewer")
+            if author_reviewer:
+                tracked.add(author_reviewer)
 
         return tracked
 
     def _update_submissions(
-        self, args: Namespace, client, last_update: int, dry_run: bool
+        self,
+        args: Namespace,
+        client,
+        last_update: int,
+        dry_run: bool,
+        index: dict[str, dict],
     ) -> tuple[list[str], int, int]:
         """
         Update submissions cache with new/modified submissions.
@@ -120,11 +216,32 @@ class UpdateCommand(Command):
             ("Desk_Rejected_Submission", "Desk-rejected submission"),
         ]
         submissions_cache_dir = Path(args.cache_dir) / "submissions"
+        if not dry_run:
+            submissions_cache_dir.mkdir(parents=True, exist_ok=True)
 
         new_author_ids = []
         new_count = 0
         modified_count = 0
 
+        # Cache writes go through a single background writer thread so the
+        # fetch loop is never stalled on per-file disk latency; None is the
+        # shutdown sentinel.
+        write_queue: queue.Queue[tuple[Path, bytes] | None] = queue.Queue()
+
+        def writer() -> None:
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    break
+                path, payload = item
+                try:
+                    _atomic_write(path, payload)
+                except OSError as e:
+                    log.warning(f"Failed to write {path}: {e}")
+
+        writer_thread = threading.Thread(target=writer, daemon=True)
+        writer_thread.start()
+
         for suffix, label in submission_types:
             invitation = f"{args.venue_id}/-/{suffix}"
 
@@ -146,12 +263,13 @@ class UpdateCommand(Command):
                 new_author_ids.extend(author_ids)
 
                 if not dry_run:
-                    submissions_cache_dir.mkdir(parents=True, exist_ok=True)
                     cache_path = submissions_cache_dir / f"{submission.id}.json"
                     data = submission.to_json()
                     data["number"] = submission.number
-                    with open(cache_path, "w") as f:
-                        json.dump(data, f, indent=2)
+                    index[submission.id] = self._index_entry(data)
+                    write_queue.put(
+                        (cache_path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                    )
 
                 log.info(f"{label}: {submission.id}")
 
@@ -181,15 +299,29 @@ class UpdateCommand(Command):
                         if submission.tcdate >= last_update:
                             continue
 
+                        # Skip if the cached copy already has this tmdate
+                        # (e.g. an interrupted run was resumed): re-encoding
+                        # and re-writing an identical file is pure disk churn
+                        cached_entry = index.get(submission.id)
+                        if (
+                            cached_entry
+                            and cached_entry.get("tmdate") == submission.tmdate
+                        ):
+                            continue
+
                         modified_count += 1
 
                         if not dry_run:
-                            submissions_cache_dir.mkdir(parents=True, exist_ok=True)
                             cache_path = submissions_cache_dir / f"{submission.id}.json"
                             data = submission.to_json()
                             data["number"] = submission.number
-                            with open(cache_path, "w") as f:
-                                json.dump(data, f, indent=2)
+                            index[submission.id] = self._index_entry(data)
+                            write_queue.put(
+                                (
+                                    cache_path,
+                                    orjson.dumps(data, option=orjson.OPT_INDENT_2),
+                                )
+                            )
 
                         log.info(f"Modified {suffix.lower()}: {submission.id}")
                     offset += page_size
@@ -197,6 +329,10 @@ class UpdateCommand(Command):
             except Exception as e:
                 log.warning(f"Failed to check modified {suffix}: {e}")
 
+        # Flush all pending writes before returning
+        write_queue.put(None)
+        writer_thread.join()
+
         return new_author_ids, new_count, modified_count
 
     def _update_dblp_publications(
@@ -288,8 +424,7 @@ class UpdateCommand(Command):
             if id_mapping:
                 mapping_path = Path(args.cache_dir) / "profiles" / "_id_mapping.json"
                 mapping_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(mapping_path, "w") as f:
-                    json.dump(id_mapping, f, indent=2)
+                _atomic_write_json(mapping_path, id_mapping)
                 log.info(f"Saved ID mapping for {len(id_mapping)} profiles")
 
         # Determine which profiles to update
@@ -320,20 +455,30 @@ class UpdateCommand(Command):
         # Determine whether to fetch publications
         fetch_publications = recache_publications or not recache_profiles
 
-        # Force recache for profiles that need updating
-        profile_with_papers_recache = ProfileWithPapers(
-            cache_dir=args.cache_dir,
-            recache=True,
-            skip_publications=not fetch_publications,
-        )
+        # Force recache for profiles that need updating. The per-profile
+        # fetches are independent round-trips, so run them concurrently;
+        # get_profile mutates instance state, so each task gets its own
+        # ProfileWithPapers instead of sharing one across threads.
+        def recache_profile(profile_id: str) -> None:
+            ProfileWithPapers(
+                cache_dir=args.cache_dir,
+                recache=True,
+                skip_publications=not fetch_publications,
+            ).get_profile(profile_id)
 
         updated_count = 0
-        for profile_id in profiles_to_update:
-            try:
-                profile_with_papers_recache.get_profile(profile_id)
-                updated_count += 1
-            except Exception as e:
-                log.warning(f"Failed to update profile {profile_id}: {e}")
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {
+                executor.submit(recache_profile, profile_id): profile_id
+                for profile_id in profiles_to_update
+            }
+            for future in as_completed(futures):
+                profile_id = futures[future]
+                try:
+                    future.result()
+                    updated_count += 1
+                except Exception as e:
+                    log.warning(f"Failed to update profile {profile_id}: {e}")
 
         return updated_count
 
@@ -344,8 +489,10 @@ class UpdateCommand(Command):
         Update group membership cache.
         Returns list of changed group IDs.
         """
-        changed_groups = []
+        changed_groups: set[str] = set()
         groups_cache_dir = Path(args.cache_dir) / "groups"
+        if not dry_run:
+            groups_cache_dir.mkdir(parents=True, exist_ok=True)
         group_suffixes = ["Reviewers", "Area_Chairs", "Senior_Area_Chairs"]
 
         for suffix in group_suffixes:
@@ -364,20 +511,18 @@ class UpdateCommand(Command):
 
                     if group.tmdate >= last_update:
                         if base_group_id not in changed_groups:
-                            changed_groups.append(base_group_id)
+                            changed_groups.add(base_group_id)
                             log.info(f"Group membership changed: {base_group_id}")
 
                 # Save to cache
                 if not dry_run:
-                    groups_cache_dir.mkdir(parents=True, exist_ok=True)
                     cache_path = groups_cache_dir / f"{suffix}.json"
-                    with open(cache_path, "w") as f:
-                        json.dump(group_data, f, indent=2)
+                    _atomic_write_json(cache_path, group_data)
 
             except Exception as e:
                 log.warning(f"Failed to fetch group {base_group_id}: {e}")
 
-        return changed_groups
+        return list(changed_groups)
 
     def _update_reduced_loads(self, args: Namespace, client, dry_run: bool) -> None:
         """
@@ -392,18 +537,18 @@ class UpdateCommand(Command):
             recruitment_invitation = f"{args.venue_id}/{suffix}/-/Recruitment"
             try:
                 notes = client.get_all_notes(invitation=recruitment_invitation)
-                for note in notes:
-                    content = note.content
-                    if "reduced_load" in content and content["reduced_load"].get(
-                        "value"
-                    ):
-                        user = content.get("user", {}).get("value", "")
-                        load_str = content["reduced_load"]["value"]
-                        if user and load_str:
-                            try:
-                                all_reduced_loads[user] = int(load_str)
-                            except ValueError:
-                                pass
+                # Single comprehension keeps the hot loop in C-level dict
+                # machinery; str.isdigit replaces try/except int conversion
+                all_reduced_loads.update(
+                    {
+                        user: int(load)
+                        for note in notes
+                        for content in (note.content,)
+                        if (load := content.get("reduced_load", {}).get("value"))
+                        and (user := content.get("user", {}).get("value"))
+                        and str(load).isdigit()
+                    }
+                )
             except Exception as e:
                 log.warning(f"Failed to fetch reduced loads for {suffix}: {e}")
 
@@ -411,8 +556,7 @@ class UpdateCommand(Command):
         if not dry_run and all_reduced_loads:
             reduced_loads_cache_dir.mkdir(parents=True, exist_ok=True)
             cache_path = reduced_loads_cache_dir / "reduced_loads.json"
-            with open(cache_path, "w") as f:
-                json.dump(all_reduced_loads, f, indent=2)
+            _atomic_write_json(cache_path, all_reduced_loads)
             log.info(f"Cached {len(all_reduced_loads)} reduced load entries")
 
     # Configuration for status reversions: (invitation_marker, action_pattern, reversion_pattern, cache_file)
@@ -431,31 +575,51 @@ class UpdateCommand(Command):
         ),
     ]
 
-    def _check_reversion(
-        self, forum_notes: list, action_pattern: str, reversion_pattern: str
-    ) -> bool:
+    # Same configuration keyed by invitation marker: invitation IDs end in
+    # the marker (e.g. ".../-/Withdrawn_Submission"), so an exact suffix
+    # lookup replaces substring scans over every invitation string.
+    _REVERSION_BY_MARKER = {
+        marker: (action_pat, rev_pat, cache_fn)
+        for marker, action_pat, rev_pat, cache_fn in _REVERSION_TYPES
+    }
+
+    def _check_reversions(
+        self, forum_notes: list, checks: list[tuple[str, str, str]]
+    ) -> dict[str, bool]:
         """
-        Check if an action (withdrawal/desk rejection) has been reversed.
-        Returns True if the most recent reversion is after the most recent action.
+        Check which actions (withdrawal/desk rejection) have been reversed.
+        Walks forum_notes once for all checks and returns a dict mapping each
+        check's cache filename to True if the most recent reversion is after
+        the most recent action.
         """
-        action_tcdate = None
-        reversion_tcdate = None
+        max_tcdate: dict[str, int] = {}
 
         for note in forum_notes:
             inv = note.invitations[0] if note.invitations else ""
-            if reversion_pattern in inv:
-                if reversion_tcdate is None or note.tcdate > reversion_tcdate:
-                    reversion_tcdate = note.tcdate
-            elif action_pattern in inv and "Reversion" not in inv:
-                if action_tcdate is None or note.tcdate > action_tcdate:
-                    action_tcdate = note.tcdate
-
-        return bool(
-            reversion_tcdate and action_tcdate and reversion_tcdate > action_tcdate
-        )
+            for action_pattern, reversion_pattern, _ in checks:
+                if reversion_pattern in inv:
+                    if note.tcdate > max_tcdate.get(reversion_pattern, 0):
+                        max_tcdate[reversion_pattern] = note.tcdate
+                elif action_pattern in inv and "Reversion" not in inv:
+                    if note.tcdate > max_tcdate.get(action_pattern, 0):
+                        max_tcdate[action_pattern] = note.tcdate
+
+        results = {}
+        for action_pattern, reversion_pattern, cache_fn in checks:
+            action_tcdate = max_tcdate.get(action_pattern, 0)
+            reversion_tcdate = max_tcdate.get(reversion_pattern, 0)
+            results[cache_fn] = bool(
+                reversion_tcdate and action_tcdate and reversion_tcdate > action_tcdate
+            )
+        return results
 
     def _update_status_reversions(
-        self, args: Namespace, client, last_update: int, dry_run: bool
+        self,
+        args: Namespace,
+        client,
+        last_update: int,
+        dry_run: bool,
+        index: dict[str, dict],
     ) -> tuple[int, int]:
         """
         Check for withdrawal and desk rejection reversions.
@@ -473,45 +637,59 @@ class UpdateCommand(Command):
         for _, _, _, cache_fn in self._REVERSION_TYPES:
             cache_path = submissions_cache_dir / cache_fn
             if cache_path.exists():
-                with open(cache_path) as f:
-                    prev_reversed[cache_fn] = set(json.load(f))
+                prev_reversed[cache_fn] = set(orjson.loads(cache_path.read_bytes()))
             else:
                 prev_reversed[cache_fn] = set()
 
         # Find submissions needing reversion checks: only those modified since
-        # last update, or not yet in any reversion cache
+        # last update, or not yet in any reversion cache. The metadata index
+        # replaces a full scan of the per-submission cache files.
         submissions_to_check: dict[str, list[tuple[str, str, str]]] = {}
-        for cache_file in submissions_cache_dir.glob("*.json"):
-            if cache_file.name.startswith("_"):
-                continue
-            try:
-                with open(cache_file) as f:
-                    submission = json.load(f)
-                invitations = submission.get("invitations", [])
-                sid = submission["id"]
-                tmdate = submission.get("tmdate", 0)
-                for inv_marker, action_pat, rev_pat, cache_fn in self._REVERSION_TYPES:
-                    if any(inv_marker in inv for inv in invitations):
-                        # Skip if already known and not modified since last update
-                        if sid in prev_reversed[cache_fn] and tmdate < last_update:
-                            continue
-                        submissions_to_check.setdefault(sid, []).append(
-                            (action_pat, rev_pat, cache_fn)
-                        )
-            except Exception:
-                pass
+        for sid, entry in index.items():
+            invitations = entry.get("invitations", [])
+            tmdate = entry.get("tmdate", 0)
+            suffixes = {inv.rsplit("/", 1)[-1] for inv in invitations}
+            for marker in suffixes & self._REVERSION_BY_MARKER.keys():
+                action_pat, rev_pat, cache_fn = self._REVERSION_BY_MARKER[marker]
+                # Skip if already known and not modified since last update
+                if sid in prev_reversed[cache_fn] and tmdate < last_update:
+                    continue
+                submissions_to_check.setdefault(sid, []).append(
+                    (action_pat, rev_pat, cache_fn)
+                )
 
         # Start with previously known reversions
         reversed_by_file: dict[str, set[str]] = {
             cache_fn: set(ids) for cache_fn, ids in prev_reversed.items()
         }
 
-        # Check reversions (fetch forum notes once per submission)
-        for submission_id, checks in submissions_to_check.items():
-            try:
-                forum_notes = list(client.get_all_notes(forum=submission_id))
-                for action_pat, rev_pat, cache_fn in checks:
-                    if self._check_reversion(forum_notes, action_pat, rev_pat):
+        # Check reversions (fetch forum notes once per submission); the
+        # per-forum fetches are independent network round-trips, so run
+        # them concurrently and do the pure-CPU reversion check on the
+        # main thread as results arrive
+        def fetch_forum(submission_id: str) -> list:
+            return list(client.get_all_notes(forum=submission_id))
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {
+                executor.submit(fetch_forum, sid): sid for sid in submissions_to_check
+            }
+            for future in as_completed(futures):
+                submission_id = futures[future]
+                try:
+                    forum_notes = future.result()
+                except Exception as e:
+                    log.warning(
+                        f"Failed to check status reversions for {submission_id}: {e}"
+                    )
+                    continue
+                reversed_now = self._check_reversions(
+                    forum_notes, submissions_to_check[submission_id]
+                )
+                for action_pat, rev_pat, cache_fn in submissions_to_check[
+                    submission_id
+                ]:
+                    if reversed_now[cache_fn]:
                         if submission_id not in prev_reversed[cache_fn]:
                             action_name = rev_pat.replace("_Reversion", "").replace(
                                 "_", " "
@@ -521,17 +699,12 @@ class UpdateCommand(Command):
                     else:
                         # May have been un-reversed
                         reversed_by_file[cache_fn].discard(submission_id)
-            except Exception as e:
-                log.warning(
-                    f"Failed to check status reversions for {submission_id}: {e}"
-                )
 
         # Save to cache
         if not dry_run:
             for cache_fn, reversed_ids in reversed_by_file.items():
                 cache_path = submissions_cache_dir / cache_fn
-                with open(cache_path, "w") as f:
-                    json.dump(list(reversed_ids), f, indent=2)
+                _atomic_write_json(cache_path, list(reversed_ids))
 
         return tuple(len(reversed_by_file[cfg[3]]) for cfg in self._REVERSION_TYPES)
 
@@ -546,30 +719,38 @@ class UpdateCommand(Command):
 
         total_responses = 0
         tasks_cache_dir = Path(args.cache_dir) / "tasks"
+        if not dry_run:
+            tasks_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Fetch all stage responses concurrently (each definition is an
+        # independent API call); executor.map keeps definition order so the
+        # merge below stays deterministic
+        def fetch(stage_def: dict) -> dict:
+            return fetch_stage_responses(client, args.venue_id, stage_def)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(stage_definitions))) as executor:
+            all_responses = list(executor.map(fetch, stage_definitions))
 
         # Merge responses by stage name (same stage may have multiple
         # committee definitions, e.g. AC and SAC feedback forms)
         merged: dict[str, dict] = {}
-        for stage_def in stage_definitions:
+        for stage_def, responses in zip(stage_definitions, all_responses):
             stage_name = stage_def.get("name", "")
-            responses = fetch_stage_responses(client, args.venue_id, stage_def)
             if responses:
                 merged.setdefault(stage_name, {}).update(responses)
 
         for stage_name, responses in merged.items():
             total_responses += len(responses)
             if not dry_run:
-                tasks_cache_dir.mkdir(parents=True, exist_ok=True)
                 cache_filename = stage_name.lower() + ".json"
                 cache_path = tasks_cache_dir / cache_filename
-                with open(cache_path, "w") as f:
-                    json.dump(responses, f, indent=2)
+                _atomic_write_json(cache_path, responses)
             log.info(f"Cached {len(responses)} {stage_name} responses")
 
         return total_responses
 
     def _update_desk_rejection_authors(
-        self, args: Namespace, client, dry_run: bool
+        self, args: Namespace, client, dry_run: bool, index: dict[str, dict]
     ) -> int:
         """
         For desk-rejected submissions missing 'desk_rejected_by', fetch the
@@ -580,84 +761,108 @@ class UpdateCommand(Command):
         if not submissions_cache_dir.exists():
             return 0
 
-        # Find desk-rejected submissions without desk_rejected_by
+        # Find desk-rejected submissions without desk_rejected_by via the
+        # metadata index, then load only those few cache files in full
         to_update = []
-        for cache_file in submissions_cache_dir.glob("*.json"):
-            if cache_file.name.startswith("_"):
-                continue
-            try:
-                with open(cache_file) as f:
-                    submission = json.load(f)
-                invitations = submission.get("invitations", [])
-                if any("Desk_Rejected_Submission" in inv for inv in invitations):
-                    if "desk_rejected_by" not in submission:
+        for sid, entry in index.items():
+            invitations = entry.get("invitations", [])
+            if any("Desk_Rejected_Submission" in inv for inv in invitations):
+                if "desk_rejected_by" not in entry:
+                    cache_file = submissions_cache_dir / f"{sid}.json"
+                    try:
+                        submission = orjson.loads(cache_file.read_bytes())
                         to_update.append((cache_file, submission))
-            except Exception:
-                pass
+                    except Exception:
+                        pass
 
         if not to_update:
             return 0
 
         log.info(f"Fetching desk rejection authors for {len(to_update)} submissions...")
 
-        # Resolve emails to canonical profile IDs (cache to avoid redundant lookups)
-        email_to_profile: dict[str, str] = {}
-
-        updated = 0
-        for cache_file, submission in to_update:
-            try:
-                # Find the desk rejection note among the forum replies
-                replies = list(client.get_all_notes(forum=submission["id"]))
-                desk_note = None
-                for reply in replies:
-                    if reply.id == submission["id"]:
-                        continue
-                    if reply.invitations and any(
-                        inv.endswith("/-/Desk_Rejection") for inv in reply.invitations
-                    ):
-                        desk_note = reply
-                        break
-
-                if not desk_note:
+        # Stage 1: find the desk rejection note and its authoring edit for
+        # each submission. The two round-trips per submission are
+        # independent across submissions, so run them concurrently.
+        def fetch_tauthor(submission: dict) -> str | None:
+            # Find the desk rejection note among the forum replies
+            replies = list(client.get_all_notes(forum=submission["id"]))
+            desk_note = None
+            for reply in replies:
+                if reply.id == submission["id"]:
                     continue
+                if reply.invitations and any(
+                    inv.endswith("/-/Desk_Rejection") for inv in reply.invitations
+                ):
+                    desk_note = reply
+                    break
+
+            if not desk_note:
+                return None
+
+            # Get edits for the desk rejection note to find tauthor
+            # Use the edit with the Desk_Rejection invitation (not /-/Edit fixes)
+            edits = client.get_note_edits(note_id=desk_note.id)
+            for edit in edits:
+                if (
+                    hasattr(edit, "tauthor")
+                    and edit.tauthor
+                    and edit.invitation
+                    and edit.invitation.endswith("/-/Desk_Rejection")
+                ):
+                    return edit.tauthor
+            return None
+
+        tauthor_by_id: dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {
+                executor.submit(fetch_tauthor, submission): submission
+                for _, submission in to_update
+            }
+            for future in as_completed(futures):
+                submission = futures[future]
+                try:
+                    tauthor = future.result()
+                except Exception as e:
+                    log.warning(
+                        f"Failed to get desk rejection author for {submission['id']}: {e}"
+                    )
+                    continue
+                if tauthor:
+                    tauthor_by_id[submission["id"]] = tauthor
 
-                # Get edits for the desk rejection note to find tauthor
-                # Use the edit with the Desk_Rejection invitation (not /-/Edit fixes)
-                edits = client.get_note_edits(note_id=desk_note.id)
-                tauthor = None
-                for edit in edits:
-                    if (
-                        hasattr(edit, "tauthor")
-                        and edit.tauthor
-                        and edit.invitation
-                        and edit.invitation.endswith("/-/Desk_Rejection")
-                    ):
-                        tauthor = edit.tauthor
-                        break
-
-                if tauthor and not dry_run:
-                    # Resolve email to canonical profile ID
-                    if tauthor not in email_to_profile:
-                        try:
-                            profile = client.get_profile(tauthor)
-                            email_to_profile[tauthor] = profile.id
-                        except Exception:
-                            email_to_profile[tauthor] = tauthor
-                    submission["desk_rejected_by"] = email_to_profile[tauthor]
-                    with open(cache_file, "w") as f:
-                        json.dump(submission, f, indent=2)
-                    updated += 1
+        if dry_run:
+            return 0
 
+        # Stage 2: resolve the deduplicated author emails to canonical
+        # profile IDs in a few bulk search_profiles calls (chunks of 100)
+        # instead of one get_profile round-trip per email
+        email_to_profile: dict[str, str] = {}
+        unique_tauthors = list(set(tauthor_by_id.values()))
+        for start in range(0, len(unique_tauthors), 100):
+            chunk = unique_tauthors[start : start + 100]
+            try:
+                email_results = client.search_profiles(emails=chunk)
             except Exception as e:
-                log.warning(
-                    f"Failed to get desk rejection author for {submission['id']}: {e}"
-                )
+                log.warning(f"Failed to batch resolve author emails: {e}")
+                continue
+            for email, profiles in email_results.items():
+                if profiles:
+                    email_to_profile[email] = profiles[0].id
+
+        # Cache writes stay serial on the main thread
+        updated = 0
+        for cache_file, submission in to_update:
+            tauthor = tauthor_by_id.get(submission["id"])
+            if not tauthor:
+                continue
+            submission["desk_rejected_by"] = email_to_profile.get(tauthor, tauthor)
+            index[submission["id"]] = self._index_entry(submission)
+            _atomic_write_json(cache_file, submission)
+            updated += 1
 
         return updated
 
-    def _update_preferred_emails(
-        self, args: Namespace, client, dry_run: bool
-    ) -> int:
+    def _update_preferred_emails(self, args: Namespace, client, dry_run: bool) -> int:
         """
         Fetch preferred email edges for the venue and patch cached profiles
         where the preferredEmail is masked (starts with '****').
@@ -692,12 +897,9 @@ class UpdateCommand(Command):
             return 0
 
         patched = 0
-        for cache_file in profiles_dir.glob("*.json"):
-            if cache_file.name.startswith("_"):
-                continue
+        for cache_file in _scan_json_files(profiles_dir):
             try:
-                with open(cache_file) as f:
-                    data = json.load(f)
+                data = orjson.loads(cache_file.read_bytes())
                 pid = data.get("id", "")
                 content = data.get("content", {})
                 current_email = content.get("preferredEmail", "")
@@ -707,17 +909,14 @@ class UpdateCommand(Command):
                     current_email.startswith("****") or not current_email
                 ):
                     content["preferredEmail"] = new_email
-                    with open(cache_file, "w") as f:
-                        json.dump(data, f, indent=2)
+                    _atomic_write_json(cache_file, data)
                     patched += 1
             except Exception:
                 pass
 
         return patched
 
-    def _fetch_anon_groups(
-        self, args: Namespace, client
-    ) -> dict[str, str]:
+    def _fetch_anon_groups(self, args: Namespace, client) -> dict[str, str]:
         """
         Bulk-fetch all anonymous groups (Reviewer_, Area_Chair_) in a single
         API call. Returns dict mapping anon group ID -> profile ID.
@@ -732,15 +931,16 @@ class UpdateCommand(Command):
                 if last.startswith("Reviewer_") or last.startswith("Area_Chair_"):
                     if g.members:
                         anon_to_profile[g.id] = g.members[0]
-            log.info(
-                f"Fetched {len(anon_to_profile)} anonymous groups in bulk"
-            )
+            log.info(f"Fetched {len(anon_to_profile)} anonymous groups in bulk")
         except Exception as e:
             log.warning(f"Failed to bulk-fetch anonymous groups: {e}")
         return anon_to_profile
 
     def _update_official_reviews(
-        self, args: Namespace, client, anon_to_profile: dict[str, str],
+        self,
+        args: Namespace,
+        client,
+        anon_to_profile: dict[str, str],
         dry_run: bool,
     ) -> int:
         """
@@ -810,8 +1010,7 @@ class UpdateCommand(Command):
 
         if not dry_run and all_reviews:
             cache_path = Path(args.cache_dir) / "official_reviews.json"
-            with open(cache_path, "w") as f:
-                json.dump(all_reviews, f, indent=2)
+            _atomic_write_json(cache_path, all_reviews)
 
         log.info(
             f"Cached {total_count} official reviews for {len(all_reviews)} submissions"
@@ -819,8 +1018,12 @@ class UpdateCommand(Command):
         return total_count
 
     def _update_assignments(
-        self, args: Namespace, client, anon_to_profile: dict[str, str],
+        self,
+        args: Namespace,
+        client,
+        anon_to_profile: dict[str, str],
         dry_run: bool,
+        index: dict[str, dict],
     ) -> tuple[int, int, int]:
         """
         Fetch and cache SAC, AC, and Reviewer assignments.
@@ -829,23 +1032,13 @@ class UpdateCommand(Command):
         Returns tuple of (sac_count, ac_count, reviewer_count).
         """
         assignments_cache_dir = Path(args.cache_dir) / "assignments"
+        if not dry_run:
+            assignments_cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Build submission_id -> number mapping from cache
-        id_to_number = {}
-        submissions_dir = Path(args.cache_dir) / "submissions"
-        if submissions_dir.exists():
-            for cache_file in submissions_dir.glob("*.json"):
-                if cache_file.name.startswith("_"):
-                    continue
-                try:
-                    with open(cache_file) as f:
-                        sub = json.load(f)
-                    sid = sub.get("id")
-                    num = sub.get("number")
-                    if sid and num:
-                        id_to_number[sid] = num
-                except Exception:
-                    pass
+        # Build submission_id -> number mapping from the metadata index
+        id_to_number = {
+            sid: entry["number"] for sid, entry in index.items() if entry.get("number")
+        }
 
         # Build per-submission anon lookup from bulk data:
         # (submission_number, anon_prefix) -> {profile_id -> {anon_id, readers}}
@@ -857,7 +1050,9 @@ class UpdateCommand(Command):
             parts = group_id.split("/")
             anon_id = parts[-1]  # e.g. "Reviewer_ABC"
             sub_part = parts[-2]  # e.g. "Submission123"
-            key = f"{sub_part}/{anon_id.split('_')[0]}_"  # e.g. "Submission123/Reviewer_"
+            key = (
+                f"{sub_part}/{anon_id.split('_')[0]}_"  # e.g. "Submission123/Reviewer_"
+            )
             anon_by_submission.setdefault(key, {})[profile_id] = anon_id
 
         # (role, cache_file, anonymous_group_prefix or None)
@@ -879,32 +1074,54 @@ class UpdateCommand(Command):
                 counts.append(0)
                 continue
 
-            assignments = {}
-            for group in edges:
-                submission_id = group["id"]["head"]
-                assignees = [v["tail"] for v in group["values"]]
-                number = id_to_number.get(submission_id)
-
-                assignment_list = []
-                for pid in assignees:
-                    entry = {"profile_id": pid}
-                    if anon_prefix and number:
-                        key = f"Submission{number}/{anon_prefix}"
-                        anon_id = anon_by_submission.get(key, {}).get(pid)
-                        if anon_id:
-                            entry["anon_id"] = anon_id
-                    assignment_list.append(entry)
-                assignments[submission_id] = assignment_list
-
-            counts.append(len(assignments))
-
-            if not dry_run and assignments:
-                assignments_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Stream one submission's assignments at a time straight into
+            # the cache file instead of accumulating the venue-wide dict
+            # first: peak memory stays at one group regardless of venue size.
+            handle = None
+            if not dry_run and edges:
                 cache_path = assignments_cache_dir / cache_filename
-                with open(cache_path, "w") as f:
-                    json.dump(assignments, f, indent=2)
+                tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+                handle = open(tmp_path, "wb")
+                handle.write(b"{")
 
-            log.info(f"Cached {len(assignments)} {role} assignments")
+            count = 0
+            try:
+                for group in edges:
+                    submission_id = group["id"]["head"]
+                    assignees = [v["tail"] for v in group["values"]]
+                    number = id_to_number.get(submission_id)
+
+                    assignment_list = []
+                    for pid in assignees:
+                        entry = {"profile_id": pid}
+                        if anon_prefix and number:
+                            key = f"Submission{number}/{anon_prefix}"
+                            anon_id = anon_by_submission.get(key, {}).get(pid)
+                            if anon_id:
+                                entry["anon_id"] = anon_id
+                        assignment_list.append(entry)
+
+                    if handle is not None:
+                        handle.write(b",\n" if count else b"\n")
+                        handle.write(orjson.dumps(submission_id))
+                        handle.write(b": ")
+                        handle.write(orjson.dumps(assignment_list))
+                    count += 1
+            except BaseException:
+                # Don't publish a truncated (yet well-formed) file; drop
+                # the temp file and keep the previous cache intact.
+                if handle is not None:
+                    handle.close()
+                    tmp_path.unlink(missing_ok=True)
+                raise
+
+            if handle is not None:
+                handle.write(b"\n}")
+                handle.close()
+                os.replace(tmp_path, cache_path)
+
+            counts.append(count)
+            log.info(f"Cached {count} {role} assignments")
 
         return tuple(counts)
 
@@ -944,15 +1161,19 @@ class UpdateCommand(Command):
         # Record current time as the new update timestamp
         current_time = int(datetime.now().timestamp() * 1000)
 
+        # Load (or rebuild) the submissions metadata index; helpers below
+        # consult and update it instead of rescanning the cache directory
+        submissions_index = self._load_submissions_index(args)
+
         # Step 1: Get currently tracked profiles
         log.info("Collecting tracked profiles...")
-        tracked_profiles = self._get_tracked_profiles(args, client)
+        tracked_profiles = self._get_tracked_profiles(args, client, submissions_index)
         log.info(f"Tracking {len(tracked_profiles)} profiles")
 
         # Step 2: Update submissions (discovers new authors)
         log.info("Checking for new/modified submissions...")
         new_author_ids, new_subs, modified_subs = self._update_submissions(
-            args, client, last_update, args.dry_run
+            args, client, last_update, args.dry_run, submissions_index
         )
 
         # Add new authors to tracked profiles
@@ -963,69 +1184,112 @@ class UpdateCommand(Command):
             tracked_profiles = set(args.profiles)
             log.info(f"Filtered to {len(tracked_profiles)} specified profile(s)")
 
-        # Step 3: Check for new DBLP publications (only for incremental updates)
-        log.info("Checking for new DBLP publications...")
-        profiles_with_new_pubs = self._update_dblp_publications(
-            args, last_update, tracked_profiles
-        )
-
-        # Step 4: Update changed profiles
-        log.info("Checking for profile changes...")
-        updated_profiles = self._update_profiles(
-            args,
-            tracked_profiles,
-            profiles_with_new_pubs,
-            args.dry_run,
-            recache_profiles,
-            recache_publications,
-        )
-
-        # Step 5: Patch masked emails with preferred email edges
-        log.info("Updating preferred emails...")
-        patched_emails = self._update_preferred_emails(args, client, args.dry_run)
-
-        # Step 6: Update group membership cache
-        log.info("Updating group membership cache...")
-        changed_groups = self._update_groups(args, client, last_update, args.dry_run)
-
-        # Step 7: Update reduced loads cache
-        log.info("Updating reduced loads cache...")
-        self._update_reduced_loads(args, client, args.dry_run)
-
-        # Step 8: Update custom stage responses cache
-        log.info("Updating custom stage responses cache...")
-        stage_responses_count = self._update_custom_stages(args, client, args.dry_run)
-
-        # Step 9: Bulk-fetch anonymous groups (used by reviews and assignments)
-        log.info("Fetching anonymous groups...")
-        anon_to_profile = self._fetch_anon_groups(args, client)
-
-        # Step 10: Update official reviews cache
-        log.info("Updating official reviews cache...")
-        official_reviews_count = self._update_official_reviews(
-            args, client, anon_to_profile, args.dry_run
-        )
-
-        # Step 11: Update assignments cache
-        log.info("Updating assignments cache...")
-        sac_assignments, ac_assignments, reviewer_assignments = self._update_assignments(
-            args, client, anon_to_profile, args.dry_run
-        )
-
-        # Step 12: Fetch desk rejection authors
-        log.info("Fetching desk rejection authors...")
-        desk_rejection_authors = self._update_desk_rejection_authors(
-            args, client, args.dry_run
-        )
-
-        # Step 13: Check for status reversions (withdrawal and desk rejection)
-        log.info("Checking for status reversions...")
-        reversed_withdrawals, reversed_desk_rejections = self._update_status_reversions(
-            args, client, last_update, args.dry_run
-        )
-
-        # Save new timestamp (unless dry run)
+        # Steps 3-13 are grouped into independent chains. Each chain keeps
+        # its internal ordering (profiles must be fetched before preferred
+        # emails are patched, anonymous groups before reviews/assignments),
+        # and the chains run concurrently so the wall time collapses to
+        # the slowest chain. They share the client (thread-safe) and the
+        # submissions index: the status chain overwrites values of EXISTING
+        # index keys while other chains iterate it, which is safe in
+        # CPython only because no key is ever inserted or removed here —
+        # inserting a new key mid-run would make concurrent iteration
+        # raise RuntimeError. Keep it that way.
+
+        def profiles_chain() -> tuple[set[str], int, int]:
+            # Step 3: Check for new DBLP publications (incremental only),
+            # Step 4: update changed profiles, Step 5: patch masked emails
+            log.info("Checking for new DBLP publications...")
+            profiles_with_new_pubs = self._update_dblp_publications(
+                args, last_update, tracked_profiles
+            )
+            log.info("Checking for profile changes...")
+            updated_profiles = self._update_profiles(
+                args,
+                tracked_profiles,
+                profiles_with_new_pubs,
+                args.dry_run,
+                recache_profiles,
+                recache_publications,
+            )
+            log.info("Updating preferred emails...")
+            patched_emails = self._update_preferred_emails(args, client, args.dry_run)
+            return profiles_with_new_pubs, updated_profiles, patched_emails
+
+        def groups_chain() -> list[str]:
+            # Step 6: Update group membership cache
+            log.info("Updating group membership cache...")
+            return self._update_groups(args, client, last_update, args.dry_run)
+
+        def reduced_loads_chain() -> None:
+            # Step 7: Update reduced loads cache
+            log.info("Updating reduced loads cache...")
+            self._update_reduced_loads(args, client, args.dry_run)
+
+        def stages_chain() -> int:
+            # Step 8: Update custom stage responses cache
+            log.info("Updating custom stage responses cache...")
+            return self._update_custom_stages(args, client, args.dry_run)
+
+        def reviews_chain() -> tuple[int, tuple[int, int, int]]:
+            # Step 9: Bulk-fetch anonymous groups, then Step 10: official
+            # reviews and Step 11: assignments, which both consume them
+            log.info("Fetching anonymous groups...")
+            anon_to_profile = self._fetch_anon_groups(args, client)
+            log.info("Updating official reviews cache...")
+            reviews_count = self._update_official_reviews(
+                args, client, anon_to_profile, args.dry_run
+            )
+            log.info("Updating assignments cache...")
+            assignment_counts = self._update_assignments(
+                args, client, anon_to_profile, args.dry_run, submissions_index
+            )
+            return reviews_count, assignment_counts
+
+        def status_chain() -> tuple[int, int, int]:
+            # Step 12: Fetch desk rejection authors, Step 13: check for
+            # status reversions (both walk forum notes, so keep them in
+            # one chain to avoid fetching the same forums twice in flight)
+            log.info("Fetching desk rejection authors...")
+            desk_rejection_authors = self._update_desk_rejection_authors(
+                args, client, args.dry_run, submissions_index
+            )
+            log.info("Checking for status reversions...")
+            reversed_counts = self._update_status_reversions(
+                args, client, last_update, args.dry_run, submissions_index
+            )
+            return (desk_rejection_authors, *reversed_counts)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            profiles_future = executor.submit(profiles_chain)
+            groups_future = executor.submit(groups_chain)
+            reduced_loads_future = executor.submit(reduced_loads_chain)
+            stages_future = executor.submit(stages_chain)
+            reviews_future = executor.submit(reviews_chain)
+            status_future = executor.submit(status_chain)
+
+            profiles_with_new_pubs, updated_profiles, patched_emails = (
+                profiles_future.result()
+            )
+            changed_groups = groups_future.result()
+            reduced_loads_future.result()
+            stage_responses_count = stages_future.result()
+            (
+                official_reviews_count,
+                (
+                    sac_assignments,
+                    ac_assignments,
+                    reviewer_assignments,
+                ),
+            ) = reviews_future.result()
+            (
+                desk_rejection_authors,
+                reversed_withdrawals,
+                reversed_desk_rejections,
+            ) = status_future.result()
+
+        # Save new timestamp and the submissions index (unless dry run)
         if not args.dry_run:
+            self._save_submissions_index(args, submissions_index)
             metadata["last_update_timestamp"] = current_time
             self._save_metadata(args.cache_dir, metadata)
 
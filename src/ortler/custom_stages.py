@@ -9,18 +9,60 @@ Supports two types of stages:
 - Per-submission stages: responses keyed by submission ID (e.g., initial checks)
 """
 
-import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .log import log
 from .rdf import Rdf
 
+# Interned so the tens of thousands of identical predicate/object strings
+# share one object and compare by pointer in dict lookups downstream.
+_NOVALUE = sys.intern(":novalue")
+
+# Submissions-with-replies payloads, fetched once per (client, venue) and
+# shared by every per-submission stage in a run. Without this, each stage
+# re-downloads all submissions and all their replies just to filter out
+# its own notes. The lock keeps concurrent stage fetches from racing on
+# the first (and only) download.
+_REPLIES_CACHE: dict[tuple[int, str], list] = {}
+_REPLIES_LOCK = threading.Lock()
+
+
+def _get_submissions_with_replies(client, venue_id: str) -> list:
+    """Fetch all submissions with their replies, memoized per client/venue."""
+    key = (id(client), venue_id)
+    with _REPLIES_LOCK:
+        if key not in _REPLIES_CACHE:
+            _REPLIES_CACHE[key] = list(
+                client.get_all_notes(
+                    invitation=f"{venue_id}/-/Submission", details="replies"
+                )
+            )
+        return _REPLIES_CACHE[key]
+
+
+# Parsed stage definitions keyed by path, with the file mtime they were
+# parsed at. Stage files change rarely, so repeated loads within a process
+# (update and dump both walk the stages directory) hit the cache and only
+# pay a stat per file; an edited file invalidates its entry via the mtime.
+_STAGE_DEF_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+
 
 def load_stage_definition(stage_path: Path) -> dict[str, Any]:
-    """Load a custom stage definition from JSON file."""
-    with open(stage_path) as f:
-        return json.load(f)
+    """Load a custom stage definition from JSON file, memoized by mtime."""
+    key = str(stage_path)
+    mtime = stage_path.stat().st_mtime
+    cached = _STAGE_DEF_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    stage_def = orjson.loads(stage_path.read_bytes())
+    _STAGE_DEF_CACHE[key] = (mtime, stage_def)
+    return stage_def
 
 
 def is_per_submission_stage(stage_def: dict[str, Any]) -> bool:
@@ -50,8 +92,22 @@ def build_enum_mapping(stage_def: dict[str, Any]) -> dict[str, dict[str, str]]:
     return mapping
 
 
+def _compile_stage(
+    stage_def: dict[str, Any],
+) -> tuple[tuple[str, dict[str, str] | None], ...]:
+    """
+    Flatten a stage definition into (field_name, enum_mapping_or_None)
+    pairs so the per-note extraction loop needs no membership tests.
+    """
+    enum_mapping = build_enum_mapping(stage_def)
+    return tuple(
+        (field_name, enum_mapping.get(field_name))
+        for field_name in stage_def.get("content", {})
+    )
+
+
 def _extract_response_fields(
-    note_or_dict, content_fields: list[str], enum_mapping: dict[str, dict[str, str]]
+    note_or_dict, fields: tuple[tuple[str, dict[str, str] | None], ...]
 ) -> dict[str, str]:
     """Extract response fields from a note or dict, applying enum mapping."""
     # Handle both Note objects and dicts
@@ -61,16 +117,25 @@ def _extract_response_fields(
         content = note_or_dict.get("content", {})
 
     response = {}
-    for field_name in content_fields:
-        raw_value = content.get(field_name, {})
-        if isinstance(raw_value, dict):
-            raw_value = raw_value.get("value", "")
-
-        # Map to ortler short value if available
-        if field_name in enum_mapping and raw_value in enum_mapping[field_name]:
-            response[field_name] = enum_mapping[field_name][raw_value]
-        else:
-            response[field_name] = raw_value or ""
+    try:
+        # API v2 wraps every field as {"value": ...}, so unwrap it
+        # unconditionally instead of type-checking every field; map to
+        # the ortler short value where the stage defines one
+        for field_name, mapping in fields:
+            raw_value = content.get(field_name, {}).get("value", "")
+            if mapping is not None:
+                response[field_name] = mapping.get(raw_value, raw_value or "")
+            else:
+                response[field_name] = raw_value or ""
+    except AttributeError:
+        # API v1-style flat content: values are bare scalars
+        response = {}
+        for field_name, mapping in fields:
+            raw_value = content.get(field_name, "")
+            if mapping is not None:
+                response[field_name] = mapping.get(raw_value, raw_value or "")
+            else:
+                response[field_name] = raw_value or ""
 
     return response
 
@@ -107,17 +172,14 @@ def fetch_stage_responses(
         log.warning(f"Failed to fetch responses for {stage_name}: {e}")
         return {}
 
-    enum_mapping = build_enum_mapping(stage_def)
-    content_fields = list(stage_def.get("content", {}).keys())
+    fields = _compile_stage(stage_def)
 
     responses = {}
     for note in notes:
         user_id = note.signatures[0] if note.signatures else None
         if not user_id:
             continue
-        responses[user_id] = _extract_response_fields(
-            note, content_fields, enum_mapping
-        )
+        responses[user_id] = _extract_response_fields(note, fields)
 
     return responses
 
@@ -128,24 +190,24 @@ def _fetch_per_submission_responses(
     """
     Fetch responses for a per-submission stage.
     Uses details="replies" to efficiently get all submissions with their replies
-    in a single query, then filters for the specific stage.
+    in a single query (shared across stages), then filters for the specific stage.
     Returns: {submission_id: {field_name: value, "_responder": user_id}}
     """
     stage_name = stage_def.get("name", "")
 
-    # Get all submissions with replies in one query (much faster than iterating)
+    # Get all submissions with replies in one shared query
     try:
-        submissions = list(
-            client.get_all_notes(
-                invitation=f"{venue_id}/-/Submission", details="replies"
-            )
-        )
+        submissions = _get_submissions_with_replies(client, venue_id)
     except Exception as e:
         log.warning(f"Failed to fetch submissions with replies for {stage_name}: {e}")
         return {}
 
-    enum_mapping = build_enum_mapping(stage_def)
-    content_fields = list(stage_def.get("content", {}).keys())
+    fields = _compile_stage(stage_def)
+
+    # Invitation IDs end in "/-/{stage_name}", so an exact suffix match
+    # replaces the substring scan (and cannot hit a stage whose name merely
+    # contains this one)
+    invitation_suffix = f"/-/{stage_name}"
 
     responses = {}
     for sub in submissions:
@@ -156,7 +218,7 @@ def _fetch_per_submission_responses(
         for reply in replies:
             # Check if this reply is for our stage
             reply_invs = reply.get("invitations", [])
-            if not any(stage_name in inv for inv in reply_invs):
+            if not any(inv.endswith(invitation_suffix) for inv in reply_invs):
                 continue
 
             submission_id = sub.id
@@ -164,7 +226,7 @@ def _fetch_per_submission_responses(
             if not responder_id:
                 continue
 
-            response = _extract_response_fields(reply, content_fields, enum_mapping)
+            response = _extract_response_fields(reply, fields)
             response["_responder"] = responder_id
             responses[submission_id] = response
 
@@ -190,17 +252,28 @@ def _add_per_user_triples(
     rdf: Rdf, stage_def: dict[str, Any], responses: dict[str, dict[str, str]]
 ) -> None:
     """Add RDF triples for per-user stage responses."""
+    # Predicate strings are identical across responses, so build them once
+    pred_for = {
+        field_name: sys.intern(f":task_{field_name}")
+        for field_name in stage_def.get("content", {})
+    }
+
+    triples = []
     for user_id, response in responses.items():
         person_iri = rdf.personIri(user_id)
 
         for field_name, value in response.items():
-            predicate = f":task_{field_name}"
-            rdf.add_triple(
-                person_iri,
-                predicate,
-                rdf.literal(value) if value else ":novalue",
+            predicate = pred_for.get(field_name) or f":task_{field_name}"
+            triples.append(
+                (
+                    person_iri,
+                    predicate,
+                    rdf.literal(value) if value else _NOVALUE,
+                )
             )
 
+    rdf.add_triples(triples)
+
 
 def _add_per_submission_triples(
     rdf: Rdf, stage_def: dict[str, Any], responses: dict[str, dict[str, str]]
@@ -208,22 +281,35 @@ def _add_per_submission_triples(
     """Add RDF triples for per-submission stage responses."""
     stage_name = stage_def.get("name", "").lower()
 
+    # Predicate strings are identical across responses, so build them once
+    responder_pred = sys.intern(f":task_{stage_name}_responder")
+    pred_for = {
+        field_name: sys.intern(f":task_{stage_name}_{field_name}")
+        for field_name in stage_def.get("content", {})
+    }
+
+    triples = []
     for submission_id, response in responses.items():
         paper_iri = rdf.paperIri(submission_id)
 
         for field_name, value in response.items():
             if field_name == "_responder":
                 # Link to the responder as a person
-                predicate = f":task_{stage_name}_responder"
-                rdf.add_triple(paper_iri, predicate, rdf.personIri(value))
+                triples.append((paper_iri, responder_pred, rdf.personIri(value)))
             else:
-                predicate = f":task_{stage_name}_{field_name}"
-                rdf.add_triple(
-                    paper_iri,
-                    predicate,
-                    rdf.literal(value) if value else ":novalue",
+                predicate = (
+                    pred_for.get(field_name) or f":task_{stage_name}_{field_name}"
+                )
+                triples.append(
+                    (
+                        paper_iri,
+                        predicate,
+                        rdf.literal(value) if value else _NOVALUE,
+                    )
                 )
 
+    rdf.add_triples(triples)
+
 
 def get_all_stage_definitions(
     stages_dir: str = "stages",
@@ -233,11 +319,21 @@ def get_all_stage_definitions(
     if not stages_path.exists():
         return []
 
-    definitions = []
-    for json_file in stages_path.glob("*.json"):
+    json_files = list(stages_path.glob("*.json"))
+    if not json_files:
+        return []
+
+    def load(json_file: Path) -> dict[str, Any] | None:
         try:
-            definitions.append(load_stage_definition(json_file))
+            return load_stage_definition(json_file)
         except Exception as e:
             log.warning(f"Failed to load stage definition {json_file}: {e}")
-
-    return definitions
+            return None
+
+    # The files are independent, so read and parse them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(json_files))) as executor:
+        return [
+            definition
+            for definition in executor.map(load, json_files)
+            if definition is not None
+        ]
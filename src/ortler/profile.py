@@ -2,12 +2,13 @@
 ProfileWithPapers class for handling OpenReview profile data with imported papers.
 """
 
-import json
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
+import orjson
+
 from .log import log
 from .rdf import Rdf
 from .client import get_client, get_client_v1
@@ -68,8 +69,7 @@ class ProfileWithPapers:
         mapping_path = Path(self.cache_dir) / "_id_mapping.json"
         if mapping_path.exists():
             try:
-                with open(mapping_path) as f:
-                    self._id_to_canonical = json.load(f)
+                self._id_to_canonical = orjson.loads(mapping_path.read_bytes())
             except Exception:
                 pass
 
@@ -358,9 +358,8 @@ class ProfileWithPapers:
 
         if cache_path.exists():
             try:
-                with open(cache_path, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                return orjson.loads(cache_path.read_bytes())
+            except (orjson.JSONDecodeError, IOError):
                 # If cache file is corrupted, ignore it
                 return None
 
@@ -389,8 +388,9 @@ class ProfileWithPapers:
 
         # Save to cache file using JSON
         try:
-            with open(cache_path, "w") as f:
-                json.dump(final_result, f, indent=2)
+            cache_path.write_bytes(
+                orjson.dumps(final_result, option=orjson.OPT_INDENT_2)
+            )
         except IOError:
             # If we can't write to cache, just continue without caching
             pass
@@ -2,11 +2,64 @@
 QLever API functions for SPARQL query retrieval and execution.
 """
 
+import hashlib
 import os
+from datetime import date
+from pathlib import Path
 from typing import Any
 
+import orjson
 import requests
 
+from .log import log
+
+# Raw SPARQL result JSON per query hash/URL, kept for the lifetime of the
+# process so repeated expansions (e.g. dry-run then real run) are free.
+_RESULT_CACHE: dict[str, dict[str, Any]] = {}
+
+
+def _sparql_cache_path(hash_or_url: str) -> Path:
+    """
+    On-disk cache path for a query's results, bucketed by day so stale
+    result sets expire naturally.
+    """
+    key = hashlib.sha256(
+        f"{hash_or_url}:{date.today().isoformat()}".encode()
+    ).hexdigest()
+    return Path(os.environ.get("CACHE_DIR", "cache")) / "sparql" / f"{key}.json"
+
+
+def _cached_query_result(hash_or_url: str) -> dict[str, Any]:
+    """
+    Fetch and execute the query for `hash_or_url`, caching the raw result
+    JSON both in-process and on disk (keyed by query and day). Successive
+    invocations within the same day skip the QLever round-trip entirely.
+    """
+    result = _RESULT_CACHE.get(hash_or_url)
+    if result is not None:
+        return result
+
+    cache_path = _sparql_cache_path(hash_or_url)
+    if cache_path.exists():
+        try:
+            result = orjson.loads(cache_path.read_bytes())
+            log.info(f"Using cached SPARQL results from {cache_path}")
+        except (orjson.JSONDecodeError, OSError) as e:
+            log.warning(f"Ignoring unreadable SPARQL cache {cache_path}: {e}")
+            result = None
+
+    if result is None:
+        query = get_sparql_query(hash_or_url)
+        result = issue_sparql_query(query)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(orjson.dumps(result))
+        except OSError as e:
+            log.warning(f"Could not write SPARQL cache {cache_path}: {e}")
+
+    _RESULT_CACHE[hash_or_url] = result
+    return result
+
 
 def get_sparql_query(hash_or_url: str) -> str:
     """
@@ -81,8 +134,7 @@ def query_results_by_recipient(hash_or_url: str) -> tuple[list[str], list[dict]]
           one per query result row (may contain duplicates if a recipient has multiple rows)
         - data_per_row: list of {variable: value, ...} dicts, parallel to recipients
     """
-    query = get_sparql_query(hash_or_url)
-    result = issue_sparql_query(query)
+    result = _cached_query_result(hash_or_url)
 
     bindings = result.get("results", {}).get("bindings", [])
     if not bindings:
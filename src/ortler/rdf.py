@@ -4,9 +4,13 @@ RDF helper functions for OpenReview data export.
 
 import os
 import re
-from datetime import datetime, timezone
-from typing import List, Any, Dict
+import sys
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
 
 def get_rdf_default_prefix() -> str:
@@ -29,6 +33,20 @@ def escape_rdf_literal(value: str) -> str:
     return value
 
 
+# Timestamps repeat heavily within a venue (batch-created notes share
+# creation dates), so the formatted literals are memoized.
+@lru_cache(maxsize=16384)
+def _datetime_literal(timestamp_ms: int) -> str:
+    dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+    return f'"{dt.strftime("%Y-%m-%dT%H:%M:%SZ")}"^^xsd:dateTime'
+
+
+@lru_cache(maxsize=16384)
+def _date_literal(timestamp_ms: int) -> str:
+    dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+    return f'"{dt.strftime("%Y-%m-%d")}"^^xsd:date'
+
+
 class Rdf:
     """
     RDF utility class for generating IRIs and literals and collecting triples.
@@ -47,12 +65,58 @@ class Rdf:
         if prefixes:
             self.prefixes.update(prefixes)
         self.triples: list[tuple[str, str, str]] = []
+        self._stream = None
 
     def add_triple(self, subject: str, predicate: str, object: str) -> None:
         """
-        Add a triple to the collection.
+        Add a triple to the collection, or write it directly when streaming.
         """
-        self.triples.append((subject, predicate, object))
+        if self._stream is not None:
+            self._stream.write(f"{subject} {predicate} {object} .\n".encode())
+        else:
+            self.triples.append((subject, predicate, object))
+
+    def add_triples(self, triples) -> None:
+        """
+        Add many (subject, predicate, object) triples at once. Cheaper than
+        repeated add_triple calls: collection mode extends the list in one
+        C-level call, streaming mode issues a single buffered write.
+        """
+        if self._stream is not None:
+            self._stream.write(
+                "".join(f"{s} {p} {o} .\n" for s, p, o in triples).encode()
+            )
+        else:
+            self.triples.extend(triples)
+
+    @classmethod
+    @contextmanager
+    def open_stream(cls, output: str | None = None) -> Iterator["Rdf"]:
+        """
+        Context manager that yields an Rdf which writes each triple as a
+        `subject predicate object .` line directly to the output file (or
+        stdout if `output` is None), instead of collecting triples in memory.
+        The prefix header is written once on entry.
+        """
+        rdf = cls()
+        # Write UTF-8 bytes through a 1 MiB buffer: this skips the text
+        # layer's per-write encoding and cuts write syscalls on large dumps.
+        handle = open(output, "wb", buffering=1 << 20) if output else sys.stdout.buffer
+        try:
+            for prefix, uri in rdf.prefixes.items():
+                if prefix == "":
+                    handle.write(f"@prefix : <{uri}> .\n".encode())
+                else:
+                    handle.write(f"@prefix {prefix}: <{uri}> .\n".encode())
+            handle.write(b"\n")
+            rdf._stream = handle
+            yield rdf
+        finally:
+            rdf._stream = None
+            if output:
+                handle.close()
+            else:
+                handle.flush()
 
     def as_turtle(self) -> str:
         """
@@ -163,7 +227,7 @@ class Rdf:
         escaped = escape_rdf_literal(value)
         return f'"{escaped}"'
 
-    def literalFromJson(self, obj: Dict[str, Any], path: str) -> str:
+    def literalFromJson(self, obj: dict[str, Any], path: str) -> str:
         """
         Get a value from a JSON object via a path and return as RDF literal.
         """
@@ -183,7 +247,7 @@ class Rdf:
         else:
             return ":novalue"
 
-    def iriFromJson(self, obj: Dict[str, Any], path: str, prefix: str) -> str:
+    def iriFromJson(self, obj: dict[str, Any], path: str, prefix: str) -> str:
         """
         Get a value from a JSON object via a path and return as prefixed IRI.
         """
@@ -204,12 +268,12 @@ class Rdf:
                 return f"{prefix}:{clean_id}"
         elif current is not None and not isinstance(current, (dict, list)):
             # Handle other types (numbers, booleans)
-            return f"{prefix}:{str(current)}"
+            return f"{prefix}:{current!s}"
         else:
             return ":novalue"
 
     def urlFromJson(
-        self, obj: Dict[str, Any], path: str, fallback: str = ":novalue"
+        self, obj: dict[str, Any], path: str, fallback: str = ":novalue"
     ) -> str:
         """
         Get a URL from a JSON object via a path and return as full IRI with angle brackets.
@@ -227,7 +291,7 @@ class Rdf:
         else:
             return fallback
 
-    def valuesFromJson(self, obj: Dict[str, Any], path: str) -> List[Any]:
+    def valuesFromJson(self, obj: dict[str, Any], path: str) -> list[Any]:
         """
         Get an array of values from a JSON object via a path.
         """
@@ -251,8 +315,7 @@ class Rdf:
         """
         if not timestamp_ms:
             return ":novalue"
-        dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-        return f'"{dt.strftime("%Y-%m-%dT%H:%M:%SZ")}"^^xsd:dateTime'
+        return _datetime_literal(timestamp_ms)
 
     def dateFromTimestamp(self, timestamp_ms: int | None) -> str:
         """
@@ -261,10 +324,9 @@ class Rdf:
         """
         if not timestamp_ms:
             return ":novalue"
-        dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-        return f'"{dt.strftime("%Y-%m-%d")}"^^xsd:date'
+        return _date_literal(timestamp_ms)
 
-    def dblpUrlFromBibtex(self, paper: Dict[str, Any]) -> str:
+    def dblpUrlFromBibtex(self, paper: dict[str, Any]) -> str:
         """
         Extract DBLP URL from a paper's _bibtex field.
         Handles both API v1 (string) and API v2 (dict with value key) formats.